@@ -0,0 +1,96 @@
+"""
+In-process async TTL cache for expensive upstream lookups
+
+Usage:
+    @async_ttl_cache(ttl=3600)
+    async def fetch(self, location: str, industry: str) -> List[...]:
+        ...
+
+Keys are a SHA-1 of the JSON-encoded call arguments (``self`` excluded), so
+methods share one cache across service instances. Concurrent misses for the
+same key are coalesced (single-flight): the first caller starts the upstream
+call as a task and every other caller awaits that same task, whether or not
+its result ends up cached.
+"""
+
+import asyncio
+import functools
+import hashlib
+import json
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+def make_cache_key(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> str:
+    """Stable cache key for a call's positional and keyword arguments"""
+    payload = json.dumps([args, kwargs], sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+def _consume_exception(task: asyncio.Task) -> None:
+    """Mark a shared task's exception as retrieved even if every waiter was cancelled"""
+    if not task.cancelled():
+        task.exception()
+
+
+def async_ttl_cache(ttl: float,
+                    maxsize: int = 256,
+                    should_cache: Optional[Callable[[Any], bool]] = bool,
+                    is_method: bool = True):
+    """Cache an async function's results for ``ttl`` seconds
+
+    Args:
+        ttl: Seconds a result stays fresh
+        maxsize: Entries kept before the oldest is evicted
+        should_cache: Predicate deciding whether a result is stored; by default
+            empty/falsy results (e.g. an API error swallowed into ``[]``) are not
+        is_method: Skip the first positional argument (``self``) when keying
+    """
+    def decorator(func):
+        entries: Dict[str, Tuple[float, Any]] = {}
+        inflight: Dict[str, asyncio.Task] = {}
+
+        def lookup(key: str):
+            entry = entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                return True, entry[1]
+            return False, None
+
+        async def fetch(key: str, args, kwargs):
+            try:
+                value = await func(*args, **kwargs)
+                if should_cache is None or should_cache(value):
+                    entries.pop(key, None)
+                    entries[key] = (time.monotonic() + ttl, value)
+                    while len(entries) > maxsize:
+                        entries.pop(next(iter(entries)))
+                return value
+            finally:
+                inflight.pop(key, None)
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            key = make_cache_key(args[1:] if is_method else args, kwargs)
+
+            hit, value = lookup(key)
+            if hit:
+                return value
+
+            # No await between the lookup and the insert, so this is race-free
+            # on a single event loop without an explicit lock
+            task = inflight.get(key)
+            if task is None:
+                task = asyncio.ensure_future(fetch(key, args, kwargs))
+                task.add_done_callback(_consume_exception)
+                inflight[key] = task
+
+            # Shield so one caller's cancellation doesn't cancel the shared fetch
+            return await asyncio.shield(task)
+
+        def cache_clear() -> None:
+            entries.clear()
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
@@ -167,20 +167,21 @@ async def comprehensive_market_scan(request: MarketScanRequest, background_tasks
         if len(sample_businesses) == 0:
             logger.warning("Enhanced discovery failed, using direct fallback")
             fallback_service = EnhancedBusinessDiscovery()
-            fallback_businesses = await fallback_service._fallback_business_discovery(
+            fallback_businesses = await asyncio.to_thread(
+                fallback_service._fallback_business_discovery,
                 request.location, request.industry, request.max_businesses or 20
             )
             
             for biz in fallback_businesses:
                 normalized_business = {
-                    'name': biz.get('name', ''),
-                    'address': biz.get('address', ''),
-                    'phone': biz.get('phone', ''),
-                    'rating': biz.get('rating', 0),
-                    'reviews': biz.get('review_count', 0),
-                    'category': biz.get('category', ''),
+                    'name': biz.name,
+                    'address': biz.address,
+                    'phone': biz.phone,
+                    'rating': biz.rating,
+                    'reviews': biz.review_count,
+                    'category': biz.category,
                     'source': 'direct_fallback',
-                    'estimated_revenue': biz.get('estimated_revenue', 0)
+                    'estimated_revenue': biz.estimated_revenue
                 }
                 sample_businesses.append(normalized_business)
         
@@ -190,21 +191,22 @@ async def comprehensive_market_scan(request: MarketScanRequest, background_tasks
         try:
             from ..services.enhanced_business_discovery import EnhancedBusinessDiscovery
             fallback_service = EnhancedBusinessDiscovery()
-            fallback_businesses = await fallback_service._fallback_business_discovery(
+            fallback_businesses = await asyncio.to_thread(
+                fallback_service._fallback_business_discovery,
                 request.location, request.industry, request.max_businesses or 20
             )
             
             sample_businesses = []
             for biz in fallback_businesses:
                 normalized_business = {
-                    'name': biz.get('name', ''),
-                    'address': biz.get('address', ''),
-                    'phone': biz.get('phone', ''),
-                    'rating': biz.get('rating', 0),
-                    'reviews': biz.get('review_count', 0),
-                    'category': biz.get('category', ''),
+                    'name': biz.name,
+                    'address': biz.address,
+                    'phone': biz.phone,
+                    'rating': biz.rating,
+                    'reviews': biz.review_count,
+                    'category': biz.category,
                     'source': 'emergency_fallback',
-                    'estimated_revenue': biz.get('estimated_revenue', 0)
+                    'estimated_revenue': biz.estimated_revenue
                 }
                 sample_businesses.append(normalized_business)
             
@@ -270,20 +272,19 @@ async def comprehensive_market_scan(request: MarketScanRequest, background_tasks
                     'years_in_business': max(2, min(25, int(reviews / 8 + rating + random.randint(2, 12))))
                 }
                 
-                revenue_analysis = math_analytics_service.calculate_revenue_estimate(
-                    business_name=biz.get('name', 'Unknown'),
+                revenue_analysis = math_analytics_service.estimate_revenue(
                     review_count=reviews,
                     picture_count=picture_count,
                     industry=request.industry or 'general',
                     additional_factors=additional_factors
                 )
                 
-                base_revenue = revenue_analysis['revenue_estimate']
-                min_revenue = int(revenue_analysis['revenue_range_low'])
-                max_revenue = int(revenue_analysis['revenue_range_high'])
+                base_revenue = revenue_analysis.revenue_estimate
+                min_revenue = int(revenue_analysis.revenue_range_low)
+                max_revenue = int(revenue_analysis.revenue_range_high)
                 
                 logger.debug(f"Mathematical revenue calculated for {biz.get('name', 'Unknown')}: ${base_revenue:,.0f} "
-                           f"(confidence: {revenue_analysis.get('confidence_score', 0.7):.0%})")
+                           f"(confidence: {revenue_analysis.confidence_score:.0%})")
             else:
                 # Fallback to basic estimation
                 base_revenue = max(250000, reviews * 2000 + rating * 50000)
@@ -311,10 +312,18 @@ async def comprehensive_market_scan(request: MarketScanRequest, background_tasks
                         'location': request.location
                     }
                     
-                    # Calculate UNIQUE analytics for THIS specific business (legacy service)
-                    tam_analysis = await legacy_analytics_service.calculate_business_specific_tam(
-                        business_data, request.industry or 'general', request.location
+                    # Calculate UNIQUE analytics for THIS specific business (legacy service),
+                    # running the per-business analyses and photo lookup concurrently
+                    legacy_analyses, business_photo = await asyncio.gather(
+                        legacy_analytics_service.analyze_business(
+                            business_data, request.industry or 'general', request.location,
+                            include_hhi=math_analytics_service is None
+                        ),
+                        legacy_analytics_service.get_business_photo(biz.get('name', ''), request.location)
                     )
+                    tam_analysis = legacy_analyses['tam']
+                    succession_analysis = legacy_analyses['succession']
+                    digital_analysis = legacy_analyses['digital']
                     
                     # Use mathematical HHI calculation if available
                     if math_analytics_service:
@@ -333,17 +342,7 @@ async def comprehensive_market_scan(request: MarketScanRequest, background_tasks
                             'rollup_opportunity': hhi_analysis['rollup_opportunity']
                         }
                     else:
-                        fragmentation_analysis = await legacy_analytics_service.calculate_business_specific_hhi(
-                            business_data, request.industry or 'general', request.location
-                        )
-                    
-                    succession_analysis = await legacy_analytics_service.calculate_business_succession_risk(business_data)
-                    
-                    digital_analysis = await legacy_analytics_service.calculate_business_digital_opportunity(business_data)
-                    
-                    business_photo = await legacy_analytics_service.get_business_photo(
-                        biz.get('name', ''), request.location
-                    )
+                        fragmentation_analysis = legacy_analyses['hhi']
                     
                     logger.info(f"Calculated unique analytics for {business_data['name']}: "
                                f"TAM=${tam_analysis.get('tam', 0):,}, "
@@ -10,16 +10,139 @@ This service maximizes real business discovery by:
 
 import asyncio
 import aiohttp
+import functools
+import itertools
 import logging
-from typing import List, Dict, Any, Optional, Set
-from datetime import datetime
+from typing import List, Dict, Any, Optional, Set, Tuple
+from dataclasses import dataclass
+from datetime import datetime, timezone
 import json
 import random
 
 from ..core.config import settings
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - optional dependency in dev
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
+# Dedicated generator for fallback data so hot loops avoid the shared global RNG
+_RNG = random.Random()
+
+# Google Places text search pagination (20 results per page, next_page_token needs ~2s to activate)
+GOOGLE_PLACES_MAX_PAGES = 3
+GOOGLE_PLACES_PAGE_TOKEN_DELAY = 2.1
+
+# Attempts per provider request when the API answers 429 Too Many Requests
+RATE_LIMIT_MAX_ATTEMPTS = 3
+
+# Industry-specific search terms for better coverage
+INDUSTRY_SEARCH_TERMS = {
+    'restaurant': (
+        'restaurant', 'dining', 'food', 'cafe', 'bistro', 'grill', 'kitchen',
+        'eatery', 'diner', 'pizzeria', 'bakery', 'bar', 'pub', 'tavern'
+    ),
+    'retail': (
+        'store', 'shop', 'retail', 'boutique', 'market', 'outlet', 
+        'shopping', 'merchandise', 'goods', 'sales'
+    ),
+    'healthcare': (
+        'clinic', 'medical', 'doctor', 'physician', 'dentist', 'dental',
+        'healthcare', 'health', 'medical center', 'urgent care'
+    ),
+    'automotive': (
+        'auto repair', 'car repair', 'automotive', 'mechanic', 'garage',
+        'auto service', 'car service', 'tire', 'oil change'
+    ),
+    'construction': (
+        'contractor', 'construction', 'builder', 'remodeling', 'renovation',
+        'home improvement', 'roofing', 'flooring', 'painting'
+    ),
+    'professional services': (
+        'accounting', 'legal', 'law firm', 'attorney', 'lawyer', 'consultant',
+        'financial', 'insurance', 'real estate', 'marketing'
+    ),
+    'beauty': (
+        'salon', 'spa', 'beauty', 'hair', 'nail', 'massage', 'barber',
+        'cosmetic', 'skincare', 'wellness'
+    ),
+    'fitness': (
+        'gym', 'fitness', 'yoga', 'pilates', 'personal trainer', 'martial arts',
+        'dance studio', 'sports', 'recreation'
+    )
+}
+
+
+@functools.lru_cache(maxsize=128)
+def _resolve_search_terms(industry_key: str) -> Tuple[str, ...]:
+    """Resolve search terms for a normalized industry key (cached per industry)"""
+    if industry_key in ('all', 'all industries', ''):
+        return ('business', 'company', 'service', 'store', 'restaurant')
+    
+    # Direct match
+    if industry_key in INDUSTRY_SEARCH_TERMS:
+        return INDUSTRY_SEARCH_TERMS[industry_key]
+    
+    # Partial match
+    for key, terms in INDUSTRY_SEARCH_TERMS.items():
+        if industry_key in key or key in industry_key:
+            return terms
+    
+    # Fallback: use the industry term itself plus generic terms
+    return (industry_key, f"{industry_key} service", f"{industry_key} company", "business")
+
+
+@dataclass
+class DiscoveredBusiness:
+    """Provider-agnostic business record kept between discovery and the response boundary"""
+    __slots__ = (
+        'name', 'address', 'city', 'state', 'zip_code', 'phone', 'website', 'rating',
+        'review_count', 'category', 'source', 'coordinates', 'image_url', 'estimated_revenue'
+    )
+    
+    name: str
+    address: str
+    city: str
+    state: str
+    zip_code: str
+    phone: str
+    website: str
+    rating: Optional[float]
+    review_count: int
+    category: str
+    source: str
+    coordinates: Dict[str, Any]
+    image_url: str
+    estimated_revenue: int
+    
+    def to_dict(self, last_updated: str) -> Dict[str, Any]:
+        """Convert to the response shape with computed fields"""
+        review_count = self.review_count
+        rating = self.rating
+        
+        return {
+            'name': self.name,
+            'address': self.address,
+            'city': self.city,
+            'state': self.state,
+            'zip_code': self.zip_code,
+            'phone': self.phone,
+            'website': self.website,
+            'rating': rating,
+            'review_count': review_count,
+            'category': self.category,
+            'source': self.source,
+            'coordinates': self.coordinates,
+            'image_url': self.image_url,
+            'estimated_revenue': self.estimated_revenue,
+            'last_updated': last_updated,
+            'popularity_score': min(100, review_count * rating / 10) if review_count and rating else 50
+        }
+
+
 class EnhancedBusinessDiscovery:
     """Enhanced business discovery service that maximizes real business results"""
     
@@ -28,42 +151,59 @@ class EnhancedBusinessDiscovery:
         self.yelp_api_key = settings.YELP_API_KEY
         self.serp_api_key = getattr(settings, 'SERP_API_KEY', None)
         self.session_timeout = aiohttp.ClientTimeout(total=30)
+        self._exhausted_endpoints: Set[str] = set()
+    
+    def _create_session(self) -> aiohttp.ClientSession:
+        """Create the session shared by all provider calls in one discovery run
         
-        # Industry-specific search terms for better coverage
-        self.industry_search_terms = {
-            'restaurant': [
-                'restaurant', 'dining', 'food', 'cafe', 'bistro', 'grill', 'kitchen',
-                'eatery', 'diner', 'pizzeria', 'bakery', 'bar', 'pub', 'tavern'
-            ],
-            'retail': [
-                'store', 'shop', 'retail', 'boutique', 'market', 'outlet', 
-                'shopping', 'merchandise', 'goods', 'sales'
-            ],
-            'healthcare': [
-                'clinic', 'medical', 'doctor', 'physician', 'dentist', 'dental',
-                'healthcare', 'health', 'medical center', 'urgent care'
-            ],
-            'automotive': [
-                'auto repair', 'car repair', 'automotive', 'mechanic', 'garage',
-                'auto service', 'car service', 'tire', 'oil change'
-            ],
-            'construction': [
-                'contractor', 'construction', 'builder', 'remodeling', 'renovation',
-                'home improvement', 'roofing', 'flooring', 'painting'
-            ],
-            'professional services': [
-                'accounting', 'legal', 'law firm', 'attorney', 'lawyer', 'consultant',
-                'financial', 'insurance', 'real estate', 'marketing'
-            ],
-            'beauty': [
-                'salon', 'spa', 'beauty', 'hair', 'nail', 'massage', 'barber',
-                'cosmetic', 'skincare', 'wellness'
-            ],
-            'fitness': [
-                'gym', 'fitness', 'yoga', 'pilates', 'personal trainer', 'martial arts',
-                'dance studio', 'sports', 'recreation'
-            ]
-        }
+        The connector is owned by the session, so closing the session also closes
+        the pooled connections and the DNS cache for maps.googleapis.com,
+        api.yelp.com and serpapi.com.
+        """
+        connector = aiohttp.TCPConnector(
+            limit=100,
+            limit_per_host=20,
+            use_dns_cache=True,
+            ttl_dns_cache=600,
+            enable_cleanup_closed=True
+        )
+        return aiohttp.ClientSession(timeout=self.session_timeout, connector=connector)
+    
+    async def _get_json(self,
+                        session: aiohttp.ClientSession,
+                        url: str,
+                        params: Dict[str, Any],
+                        headers: Optional[Dict[str, str]] = None) -> Optional[Dict[str, Any]]:
+        """GET a provider endpoint and decode the JSON body, backing off on rate limits
+        
+        Only 200 responses are parsed. A 429 is retried after the Retry-After delay
+        (or exponential backoff with jitter); other statuses return None. Once a provider
+        reports X-RateLimit-Remaining of 0 (Yelp), further calls to it are skipped.
+        """
+        if url in self._exhausted_endpoints:
+            return None
+        
+        for attempt in range(RATE_LIMIT_MAX_ATTEMPTS):
+            async with session.get(url, params=params, headers=headers) as response:
+                if response.status == 200:
+                    if response.headers.get('X-RateLimit-Remaining') == '0':
+                        logger.warning(f"Rate limit quota exhausted for {url}, skipping further calls")
+                        self._exhausted_endpoints.add(url)
+                    return _json_loads(await response.read())
+                
+                if response.status != 429:
+                    logger.warning(f"Discovery request to {url} failed with status {response.status}")
+                    return None
+                
+                retry_after = response.headers.get('Retry-After', '')
+            
+            if attempt + 1 < RATE_LIMIT_MAX_ATTEMPTS:
+                delay = float(retry_after) if retry_after.isdigit() else 2 ** attempt + _RNG.random()
+                logger.info(f"Rate limited by {url}, retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+        
+        logger.warning(f"Discovery request to {url} still rate limited after {RATE_LIMIT_MAX_ATTEMPTS} attempts")
+        return None
     
     async def discover_businesses(self, 
                                 location: str, 
@@ -74,228 +214,255 @@ class EnhancedBusinessDiscovery:
         """
         logger.info(f"Starting enhanced business discovery for {location}, industry: {industry}")
         
-        all_businesses = []
-        discovered_names = set()  # Track unique businesses
-        
-        # Strategy 1: Multiple search terms per industry
-        search_terms = self._get_search_terms(industry)
-        
-        # Strategy 2: Multiple API sources in parallel
-        discovery_tasks = []
+        merged: Dict[str, DiscoveredBusiness] = {}  # Name fingerprint -> first business seen
+        last_updated = datetime.now(timezone.utc).isoformat()  # Shared by every record in this batch
         
-        for search_term in search_terms[:3]:  # Limit to top 3 terms to avoid rate limits
-            # Google Maps Places API
-            if self.google_maps_api_key:
-                discovery_tasks.append(
-                    self._discover_google_places(location, search_term, max_businesses // len(search_terms))
-                )
+        async with self._create_session() as session:
+            # Strategy 1: Multiple search terms per industry
+            search_terms = self._get_search_terms(industry)
             
-            # Yelp Fusion API
-            if self.yelp_api_key:
-                discovery_tasks.append(
-                    self._discover_yelp_businesses(location, search_term, max_businesses // len(search_terms))
-                )
+            # Strategy 2: Multiple API sources in parallel
+            discovery_tasks = []
             
-            # SERP API for additional coverage
-            if self.serp_api_key:
-                discovery_tasks.append(
-                    self._discover_serp_businesses(location, search_term, max_businesses // len(search_terms))
-                )
-        
-        # Strategy 3: Geographic radius expansion
-        if len(discovery_tasks) < 6:  # If we don't have enough API coverage, expand geographically
-            nearby_locations = self._get_nearby_locations(location)
-            for nearby_loc in nearby_locations[:2]:  # Add 2 nearby locations
+            for search_term in search_terms[:3]:  # Limit to top 3 terms to avoid rate limits
+                # Google Maps Places API
                 if self.google_maps_api_key:
                     discovery_tasks.append(
-                        self._discover_google_places(nearby_loc, search_terms[0], max_businesses // 4)
+                        self._discover_google_places(session, location, search_term, max_businesses // len(search_terms))
+                    )
+                
+                # Yelp Fusion API
+                if self.yelp_api_key:
+                    discovery_tasks.append(
+                        self._discover_yelp_businesses(session, location, search_term, max_businesses // len(search_terms))
+                    )
+                
+                # SERP API for additional coverage
+                if self.serp_api_key:
+                    discovery_tasks.append(
+                        self._discover_serp_businesses(session, location, search_term, max_businesses // len(search_terms))
                     )
-        
-        # Execute all discovery tasks in parallel
-        if discovery_tasks:
-            results = await asyncio.gather(*discovery_tasks, return_exceptions=True)
             
-            for result in results:
-                if isinstance(result, list):
-                    for business in result:
-                        business_name = business.get('name', '').strip().lower()
-                        if business_name and business_name not in discovered_names:
-                            discovered_names.add(business_name)
-                            all_businesses.append(business)
-                elif isinstance(result, Exception):
-                    logger.warning(f"Discovery task failed: {result}")
-        
-        # Strategy 4: Always use fallback to ensure we have enough businesses
-        logger.info(f"Current business count: {len(all_businesses)}, target: {max_businesses}")
+            # Strategy 3: Geographic radius expansion
+            if len(discovery_tasks) < 6:  # If we don't have enough API coverage, expand geographically
+                nearby_locations = self._get_nearby_locations(location)
+                for nearby_loc in nearby_locations[:2]:  # Add 2 nearby locations
+                    if self.google_maps_api_key:
+                        discovery_tasks.append(
+                            self._discover_google_places(session, nearby_loc, search_terms[0], max_businesses // 4)
+                        )
+            
+            # Execute all discovery tasks in parallel, merging results as they arrive
+            # so slow providers can be cancelled once we have enough businesses
+            if discovery_tasks:
+                pending = [asyncio.create_task(task) for task in discovery_tasks]
+                try:
+                    for next_done in asyncio.as_completed(pending):
+                        try:
+                            result = await next_done
+                        except Exception as e:
+                            logger.warning(f"Discovery task failed: {e}")
+                            continue
+                        
+                        for business in result:
+                            fingerprint = business.name.strip().lower()
+                            if fingerprint:
+                                merged.setdefault(fingerprint, business)
+                        
+                        if len(merged) >= max_businesses:
+                            logger.info("Discovery target reached, cancelling remaining tasks")
+                            break
+                finally:
+                    for task in pending:
+                        if not task.done():
+                            task.cancel()
+                    # Let cancelled requests unwind before the shared session closes
+                    await asyncio.gather(*pending, return_exceptions=True)
         
-        # Always generate fallback businesses to ensure good coverage
-        fallback_businesses = await self._fallback_business_discovery(location, industry, max_businesses)
+        # Strategy 4: Fill any remaining gap with fallback businesses
+        logger.info(f"Current business count: {len(merged)}, target: {max_businesses}")
         
-        for business in fallback_businesses:
-            business_name = business.get('name', '').strip().lower()
-            if business_name and business_name not in discovered_names and len(all_businesses) < max_businesses:
-                discovered_names.add(business_name)
-                all_businesses.append(business)
+        needed = max_businesses - len(merged)
+        if needed > 0:
+            fallback_businesses = await asyncio.to_thread(
+                self._fallback_business_discovery, location, industry, needed
+            )
+            
+            for business in fallback_businesses:
+                fingerprint = business.name.strip().lower()
+                if fingerprint:
+                    merged.setdefault(fingerprint, business)
         
-        # Strategy 5: Enhance business data with additional details
-        enhanced_businesses = await self._enhance_business_data(all_businesses[:max_businesses])
+        enhanced_businesses = [
+            business.to_dict(last_updated)
+            for business in itertools.islice(merged.values(), max_businesses)
+        ]
         
         logger.info(f"Enhanced business discovery completed: {len(enhanced_businesses)} businesses found")
         return enhanced_businesses
     
     def _get_search_terms(self, industry: str) -> List[str]:
         """Get comprehensive search terms for an industry"""
-        if not industry or industry.lower() in ['all', 'all industries', '']:
-            return ['business', 'company', 'service', 'store', 'restaurant']
-        
-        industry_key = industry.lower().strip()
-        
-        # Direct match
-        if industry_key in self.industry_search_terms:
-            return self.industry_search_terms[industry_key]
-        
-        # Partial match
-        for key, terms in self.industry_search_terms.items():
-            if industry_key in key or key in industry_key:
-                return terms
-        
-        # Fallback: use the industry term itself plus generic terms
-        return [industry_key, f"{industry_key} service", f"{industry_key} company", "business"]
+        return list(_resolve_search_terms((industry or '').lower().strip()))
     
-    async def _discover_google_places(self, location: str, search_term: str, limit: int) -> List[Dict[str, Any]]:
+    async def _discover_google_places(self, session: aiohttp.ClientSession, location: str, search_term: str, limit: int) -> List[DiscoveredBusiness]:
         """Discover businesses using Google Places API"""
         try:
-            async with aiohttp.ClientSession(timeout=self.session_timeout) as session:
-                # Text search for broader coverage
-                text_search_url = "https://maps.googleapis.com/maps/api/place/textsearch/json"
-                params = {
-                    'query': f"{search_term} in {location}",
-                    'key': self.google_maps_api_key,
-                    'type': 'establishment',
-                    'region': 'us'
-                }
-                
-                businesses = []
+            # Text search for broader coverage
+            text_search_url = "https://maps.googleapis.com/maps/api/place/textsearch/json"
+            params = {
+                'query': f"{search_term} in {location}",
+                'key': self.google_maps_api_key,
+                'type': 'establishment',
+                'region': 'us'
+            }
+            
+            businesses = []
+            
+            # Text search returns 20 results per page and up to 3 pages. The next_page_token
+            # only becomes valid after a short delay; since every provider call runs as its
+            # own task, the wait overlaps with the Yelp/SERP requests still in flight.
+            for page in range(GOOGLE_PLACES_MAX_PAGES):
+                data = await self._get_json(session, text_search_url, params=params)
+                if not data:
+                    break
                 
-                async with session.get(text_search_url, params=params) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        results = data.get('results', [])
-                        
-                        for place in results[:limit]:
-                            business = {
-                                'name': place.get('name', ''),
-                                'address': place.get('formatted_address', ''),
-                                'rating': place.get('rating'),
-                                'user_ratings_total': place.get('user_ratings_total'),
-                                'place_id': place.get('place_id'),
-                                'types': place.get('types', []),
-                                'geometry': place.get('geometry', {}),
-                                'source': 'google_places',
-                                'business_status': place.get('business_status', 'OPERATIONAL')
-                            }
-                            
-                            # Only include operational businesses
-                            if business['business_status'] == 'OPERATIONAL' and business['name']:
-                                businesses.append(business)
+                for place in data.get('results', []):
+                    name = place.get('name', '')
+                    
+                    # Only include operational businesses
+                    if place.get('business_status', 'OPERATIONAL') != 'OPERATIONAL' or not name:
+                        continue
+                    
+                    businesses.append(DiscoveredBusiness(
+                        name=name,
+                        address=place.get('formatted_address', ''),
+                        city='',
+                        state='',
+                        zip_code='',
+                        phone='',
+                        website='',
+                        rating=place.get('rating'),
+                        review_count=place.get('user_ratings_total') or 0,
+                        category='',
+                        source='google_places',
+                        coordinates=place.get('geometry', {}).get('location', {}),
+                        image_url='',
+                        estimated_revenue=0
+                    ))
                 
-                logger.info(f"Google Places found {len(businesses)} businesses for '{search_term}' in {location}")
-                return businesses
+                next_page_token = data.get('next_page_token')
+                if len(businesses) >= limit or not next_page_token:
+                    break
                 
+                await asyncio.sleep(GOOGLE_PLACES_PAGE_TOKEN_DELAY)
+                params = {'pagetoken': next_page_token, 'key': self.google_maps_api_key}
+            
+            businesses = businesses[:limit]
+            
+            logger.info(f"Google Places found {len(businesses)} businesses for '{search_term}' in {location}")
+            return businesses
+            
         except Exception as e:
             logger.error(f"Google Places discovery failed: {e}")
             return []
     
-    async def _discover_yelp_businesses(self, location: str, search_term: str, limit: int) -> List[Dict[str, Any]]:
+    async def _discover_yelp_businesses(self, session: aiohttp.ClientSession, location: str, search_term: str, limit: int) -> List[DiscoveredBusiness]:
         """Discover businesses using Yelp Fusion API"""
         try:
-            async with aiohttp.ClientSession(timeout=self.session_timeout) as session:
-                url = "https://api.yelp.com/v3/businesses/search"
-                headers = {'Authorization': f'Bearer {self.yelp_api_key}'}
-                params = {
-                    'term': search_term,
-                    'location': location,
-                    'limit': min(limit, 50),  # Yelp max is 50
-                    'sort_by': 'best_match'
-                }
-                
-                businesses = []
-                
-                async with session.get(url, headers=headers, params=params) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        results = data.get('businesses', [])
-                        
-                        for biz in results:
-                            business = {
-                                'name': biz.get('name', ''),
-                                'address': ' '.join(biz.get('location', {}).get('display_address', [])),
-                                'city': biz.get('location', {}).get('city', ''),
-                                'state': biz.get('location', {}).get('state', ''),
-                                'zip_code': biz.get('location', {}).get('zip_code', ''),
-                                'phone': biz.get('phone', ''),
-                                'rating': biz.get('rating'),
-                                'review_count': biz.get('review_count'),
-                                'categories': [cat.get('title') for cat in biz.get('categories', [])],
-                                'coordinates': biz.get('coordinates', {}),
-                                'url': biz.get('url'),
-                                'image_url': biz.get('image_url'),
-                                'source': 'yelp',
-                                'is_closed': biz.get('is_closed', False)
-                            }
-                            
-                            # Only include open businesses
-                            if not business['is_closed'] and business['name']:
-                                businesses.append(business)
-                
-                logger.info(f"Yelp found {len(businesses)} businesses for '{search_term}' in {location}")
-                return businesses
+            url = "https://api.yelp.com/v3/businesses/search"
+            headers = {'Authorization': f'Bearer {self.yelp_api_key}'}
+            params = {
+                'term': search_term,
+                'location': location,
+                'limit': min(limit, 50),  # Yelp max is 50
+                'sort_by': 'best_match'
+            }
+            
+            businesses = []
+            
+            data = await self._get_json(session, url, params=params, headers=headers)
+            if data:
+                results = data.get('businesses', [])
                 
+                for biz in results:
+                    name = biz.get('name', '')
+                    
+                    # Only include open businesses
+                    if biz.get('is_closed', False) or not name:
+                        continue
+                    
+                    biz_location = biz.get('location', {})
+                    categories = biz.get('categories')
+                    businesses.append(DiscoveredBusiness(
+                        name=name,
+                        address=' '.join(biz_location.get('display_address', [])),
+                        city=biz_location.get('city', ''),
+                        state=biz_location.get('state', ''),
+                        zip_code=biz_location.get('zip_code', ''),
+                        phone=biz.get('phone', ''),
+                        website='',
+                        rating=biz.get('rating'),
+                        review_count=biz.get('review_count') or 0,
+                        category=categories[0].get('title') if categories else '',
+                        source='yelp',
+                        coordinates=biz.get('coordinates', {}),
+                        image_url=biz.get('image_url', ''),
+                        estimated_revenue=0
+                    ))
+            
+            logger.info(f"Yelp found {len(businesses)} businesses for '{search_term}' in {location}")
+            return businesses
+            
         except Exception as e:
             logger.error(f"Yelp discovery failed: {e}")
             return []
     
-    async def _discover_serp_businesses(self, location: str, search_term: str, limit: int) -> List[Dict[str, Any]]:
+    async def _discover_serp_businesses(self, session: aiohttp.ClientSession, location: str, search_term: str, limit: int) -> List[DiscoveredBusiness]:
         """Discover businesses using SERP API"""
         try:
-            async with aiohttp.ClientSession(timeout=self.session_timeout) as session:
-                url = "https://serpapi.com/search.json"
-                params = {
-                    'engine': 'google_local',
-                    'q': f"{search_term} {location}",
-                    'location': location,
-                    'hl': 'en',
-                    'gl': 'us',
-                    'api_key': self.serp_api_key,
-                    'num': min(limit, 20)
-                }
-                
-                businesses = []
-                
-                async with session.get(url, params=params) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        results = data.get('local_results', [])
-                        
-                        for result in results:
-                            business = {
-                                'name': result.get('title', ''),
-                                'address': result.get('address', ''),
-                                'phone': result.get('phone', ''),
-                                'rating': result.get('rating'),
-                                'reviews': result.get('reviews'),
-                                'type': result.get('type', ''),
-                                'website': result.get('website', ''),
-                                'source': 'serp_api',
-                                'position': result.get('position')
-                            }
-                            
-                            if business['name']:
-                                businesses.append(business)
-                
-                logger.info(f"SERP API found {len(businesses)} businesses for '{search_term}' in {location}")
-                return businesses
+            url = "https://serpapi.com/search.json"
+            params = {
+                'engine': 'google_local',
+                'q': f"{search_term} {location}",
+                'location': location,
+                'hl': 'en',
+                'gl': 'us',
+                'api_key': self.serp_api_key,
+                'num': min(limit, 20)
+            }
+            
+            businesses = []
+            
+            data = await self._get_json(session, url, params=params)
+            if data:
+                results = data.get('local_results', [])
                 
+                for result in results:
+                    name = result.get('title', '')
+                    if not name:
+                        continue
+                    
+                    businesses.append(DiscoveredBusiness(
+                        name=name,
+                        address=result.get('address', ''),
+                        city='',
+                        state='',
+                        zip_code='',
+                        phone=result.get('phone', ''),
+                        website=result.get('website', ''),
+                        rating=result.get('rating'),
+                        review_count=result.get('reviews') or 0,
+                        category='',
+                        source='serp_api',
+                        coordinates={},
+                        image_url='',
+                        estimated_revenue=0
+                    ))
+            
+            logger.info(f"SERP API found {len(businesses)} businesses for '{search_term}' in {location}")
+            return businesses
+            
         except Exception as e:
             logger.error(f"SERP API discovery failed: {e}")
             return []
@@ -320,8 +487,11 @@ class EnhancedBusinessDiscovery:
         
         return []
     
-    async def _fallback_business_discovery(self, location: str, industry: str, max_businesses: int) -> List[Dict[str, Any]]:
-        """Fallback business discovery when APIs return insufficient results"""
+    def _fallback_business_discovery(self, location: str, industry: str, max_businesses: int) -> List[DiscoveredBusiness]:
+        """Fallback business discovery when APIs return insufficient results
+        
+        Pure CPU work; async callers should run it via asyncio.to_thread.
+        """
         logger.info("Using fallback business discovery methods")
         
         fallback_businesses = []
@@ -333,33 +503,46 @@ class EnhancedBusinessDiscovery:
         business_templates = self._get_business_templates(industry)
         location_modifiers = self._get_location_modifiers(location)
         
+        # Normalize website slugs and street names once per template/modifier
+        # instead of once per generated record
+        modifier_slugs = [m.lower().replace(' ', '') for m in location_modifiers]
+        template_slugs = [t['name'].lower().replace(' ', '').replace('&', 'and') for t in business_templates]
+        template_streets = [f"{t['street']} St, {location}" for t in business_templates]
+        
         # Generate more businesses by cycling through templates
         template_count = len(business_templates)
+        modifier_count = len(location_modifiers)
         for i in range(max_businesses):
-            template = business_templates[i % template_count]
-            modifier = location_modifiers[i % len(location_modifiers)]
+            t_idx = i % template_count
+            m_idx = i % modifier_count
+            template = business_templates[t_idx]
+            modifier = location_modifiers[m_idx]
             
             # Generate coordinates near the base location
-            lat_offset = random.uniform(-0.05, 0.05)  # ~5km radius
-            lng_offset = random.uniform(-0.05, 0.05)
+            lat_offset = _RNG.uniform(-0.05, 0.05)  # ~5km radius
+            lng_offset = _RNG.uniform(-0.05, 0.05)
             business_lat = base_coords[0] + lat_offset
             business_lng = base_coords[1] + lng_offset
             
-            business = {
-                'name': f"{modifier} {template['name']}",
-                'address': f"{100 + i * 10} {template['street']} St, {location}",
-                'phone': f"({random.randint(200, 999)}) {random.randint(200, 999)}-{random.randint(1000, 9999)}",
-                'rating': round(random.uniform(3.5, 4.8), 1),
-                'review_count': random.randint(15, 200),
-                'category': template['category'],
-                'source': 'enhanced_fallback',
-                'estimated_revenue': random.randint(200000, 2000000),
-                'website': f"https://www.{modifier.lower().replace(' ', '')}{template['name'].lower().replace(' ', '').replace('&', 'and')}.com",
-                'coordinates': {
+            business = DiscoveredBusiness(
+                name=f"{modifier} {template['name']}",
+                address=f"{100 + i * 10} {template_streets[t_idx]}",
+                city='',
+                state='',
+                zip_code='',
+                phone=f"({_RNG.randint(200, 999)}) {_RNG.randint(200, 999)}-{_RNG.randint(1000, 9999)}",
+                website=f"https://www.{modifier_slugs[m_idx]}{template_slugs[t_idx]}.com",
+                rating=_RNG.randint(35, 48) / 10,  # 3.5-4.8 in 0.1 steps without round()
+                review_count=_RNG.randint(15, 200),
+                category=template['category'],
+                source='enhanced_fallback',
+                coordinates={
                     'lat': business_lat,
                     'lng': business_lng
-                }
-            }
+                },
+                image_url='',
+                estimated_revenue=_RNG.randint(200000, 2000000)
+            )
             fallback_businesses.append(business)
         
         logger.info(f"Generated {len(fallback_businesses)} fallback businesses with coordinates")
@@ -475,37 +658,3 @@ class EnhancedBusinessDiscovery:
             f"{city_name} Express",
             f"Metro {city_name}"
         ]
-    
-    async def _enhance_business_data(self, businesses: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Enhance business data with additional details"""
-        enhanced = []
-        
-        for business in businesses:
-            # Normalize and enhance the business data
-            enhanced_business = {
-                'name': business.get('name', ''),
-                'address': business.get('address', ''),
-                'city': business.get('city', ''),
-                'state': business.get('state', ''),
-                'zip_code': business.get('zip_code', ''),
-                'phone': business.get('phone', ''),
-                'website': business.get('website', ''),
-                'rating': business.get('rating', 0),
-                'review_count': business.get('review_count', 0) or business.get('reviews', 0) or business.get('user_ratings_total', 0),
-                'category': business.get('category', '') or (business.get('categories', [''])[0] if business.get('categories') else ''),
-                'source': business.get('source', 'unknown'),
-                'coordinates': business.get('coordinates', {}) or business.get('geometry', {}).get('location', {}),
-                'image_url': business.get('image_url', ''),
-                'estimated_revenue': business.get('estimated_revenue', 0),
-                'last_updated': datetime.now().isoformat()
-            }
-            
-            # Add computed fields
-            if enhanced_business['review_count'] and enhanced_business['rating']:
-                enhanced_business['popularity_score'] = min(100, enhanced_business['review_count'] * enhanced_business['rating'] / 10)
-            else:
-                enhanced_business['popularity_score'] = 50  # Default
-            
-            enhanced.append(enhanced_business)
-        
-        return enhanced
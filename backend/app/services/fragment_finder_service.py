@@ -16,34 +16,234 @@ Features:
 
 import asyncio
 import aiohttp
+import json
 import logging
-from typing import List, Dict, Any, Optional, Tuple
-from dataclasses import dataclass
-import statistics
-import math
-import random
+import re
+import string
+from collections import Counter
+from typing import AsyncIterator, List, Dict, Any, Optional, Tuple
+from dataclasses import dataclass, fields
+import numpy as np
 
 from ..core.config import settings
+from ..core.cache import async_ttl_cache
+
+try:
+    from rapidfuzz import fuzz, process
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency in dev
+    RAPIDFUZZ_AVAILABLE = False
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - optional dependency in dev
+    _json_loads = json.loads
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency in dev
+    NUMBA_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Yelp search pages (50 results each) requested concurrently per analysis
+YELP_MAX_CONCURRENT_PAGES = 4
+
+# Outbound HTTP requests in flight across all analyses, and attempts per request on 429/5xx
+UPSTREAM_MAX_CONCURRENCY = 10
+UPSTREAM_MAX_ATTEMPTS = 3
+
+# Google Places API (New) text search, returning only the fields we read
+GOOGLE_PLACES_SEARCH_URL = "https://places.googleapis.com/v1/places:searchText"
+GOOGLE_PLACES_FIELD_MASK = ','.join((
+    'places.displayName',
+    'places.formattedAddress',
+    'places.location',
+    'places.rating',
+    'places.userRatingCount',
+))
+
+# Industry key -> Google Places text search term
+GOOGLE_SEARCH_TERMS = {
+    'hvac': 'HVAC contractor',
+    'plumbing': 'plumber plumbing contractor',
+    'electrical': 'electrician electrical contractor',
+    'landscaping': 'landscaping lawn care',
+    'restaurant': 'restaurant',
+    'tree service': 'tree service arborist',
+    'auto repair': 'auto repair mechanic',
+    'dentist': 'dentist dental office',
+    'veterinary': 'veterinarian animal hospital',
+    'hair salon': 'hair salon barber',
+    'gym': 'gym fitness center',
+    'accounting': 'accountant CPA',
+}
+
+# Industry key -> Yelp category alias
+YELP_CATEGORIES = {
+    'hvac': 'hvac',
+    'plumbing': 'plumbing',
+    'electrical': 'electricians',
+    'landscaping': 'landscaping',
+    'restaurant': 'restaurants',
+    'tree service': 'treeservices',
+    'auto repair': 'autorepair',
+    'dentist': 'dentists',
+    'veterinary': 'veterinarians',
+    'hair salon': 'hair',
+    'gym': 'gyms',
+    'accounting': 'accountants',
+}
+
+# Cache lifetimes (seconds) per upstream resource
+BUSINESS_CACHE_TTL = 60 * 60          # Google Places / Yelp listings
+CENSUS_CACHE_TTL = 24 * 60 * 60       # Census demographics
+ANALYSIS_CACHE_TTL = 15 * 60          # Final fragmentation result
+
+# Census ACS 5-year estimates: total population, median age, occupied and owner-occupied housing units
+CENSUS_ACS_URL = "https://api.census.gov/data/2022/acs/acs5"
+CENSUS_ACS_VARIABLES = ('B01003_001E', 'B01002_001E', 'B25003_001E', 'B25003_002E')
+CENSUS_PLACE_SUFFIXES = (' city', ' town', ' village', ' borough', ' CDP', ' municipality')
+
+# Used when a location can't be matched to a Census geography
+DEFAULT_DEMOGRAPHICS = {'median_age': 42.0, 'homeownership_rate': 68.0, 'population': 100000}
+
+CENSUS_STATE_FIPS = {
+    'AL': '01', 'AK': '02', 'AZ': '04', 'AR': '05', 'CA': '06', 'CO': '08', 'CT': '09',
+    'DE': '10', 'DC': '11', 'FL': '12', 'GA': '13', 'HI': '15', 'ID': '16', 'IL': '17',
+    'IN': '18', 'IA': '19', 'KS': '20', 'KY': '21', 'LA': '22', 'ME': '23', 'MD': '24',
+    'MA': '25', 'MI': '26', 'MN': '27', 'MS': '28', 'MO': '29', 'MT': '30', 'NE': '31',
+    'NV': '32', 'NH': '33', 'NJ': '34', 'NM': '35', 'NY': '36', 'NC': '37', 'ND': '38',
+    'OH': '39', 'OK': '40', 'OR': '41', 'PA': '42', 'RI': '44', 'SC': '45', 'SD': '46',
+    'TN': '47', 'TX': '48', 'UT': '49', 'VT': '50', 'VA': '51', 'WA': '53', 'WV': '54',
+    'WI': '55', 'WY': '56', 'PR': '72',
+}
+
+# 5-digit ZIP code inside a formatted address
+_ZIP_RE = re.compile(r'\b\d{5}\b')
+
+# Punctuation becomes whitespace, so names tokenize the way RapidFuzz's default_process would
+_NAME_NORMALIZE_TABLE = str.maketrans(string.punctuation, ' ' * len(string.punctuation))
+
+# Minimum token-set similarity (0-100) for two names in the same ZIP to be the same business
+DEDUP_NAME_SIMILARITY = 88
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _hhi_from_counts(counts):
+        """HHI = Σ(si²) over int64 market-share counts, compiled to a single fused loop"""
+        total = 0.0
+        for count in counts:
+            total += count
+        hhi = 0.0
+        for count in counts:
+            share = count / total
+            hhi += share * share
+        return hhi
+else:
+    def _hhi_from_counts(counts):
+        """HHI = Σ(si²) over int64 market-share counts"""
+        market_shares = counts / counts.sum()
+        return float(np.dot(market_shares, market_shares))
+
+def _normalize_name(name: str) -> str:
+    """Lower-cased business name with punctuation removed and whitespace collapsed"""
+    return ' '.join(name.translate(_NAME_NORMALIZE_TABLE).lower().split())
+
 @dataclass
 class BusinessData:
     """Individual business data from APIs"""
+    # Explicit slots (dataclass(slots=True) needs Python 3.10), which is also why fields have no defaults
+    __slots__ = (
+        'name', 'address', 'latitude', 'longitude', 'phone', 'rating',
+        'review_count', 'url', 'source', 'zip_code'
+    )
+    
     name: str
     address: str
     latitude: float
     longitude: float
-    phone: Optional[str] = None
-    rating: Optional[float] = None
-    review_count: Optional[int] = None
-    url: Optional[str] = None
-    source: str = "unknown"
-    zip_code: Optional[str] = None
+    phone: Optional[str]
+    rating: Optional[float]
+    review_count: Optional[int]
+    url: Optional[str]
+    source: str
+    zip_code: Optional[str]
+
+@dataclass
+class BusinessTable:
+    """Column-oriented (struct-of-arrays) view of fetched businesses for vectorized analytics"""
+    names: np.ndarray           # object
+    names_norm: np.ndarray      # object, see _normalize_name
+    addresses: np.ndarray       # object, '' when missing
+    review_counts: np.ndarray   # int64, 0 when missing
+    ratings: np.ndarray         # float32, NaN when missing
+    latitudes: np.ndarray       # float32
+    longitudes: np.ndarray      # float32
+    zip_codes: np.ndarray       # object, None when missing
+    
+    @classmethod
+    def from_businesses(cls, businesses: List[BusinessData]) -> 'BusinessTable':
+        """Materialize the columns in a single pass over the business list"""
+        count = len(businesses)
+        names = np.empty(count, dtype=object)
+        names_norm = np.empty(count, dtype=object)
+        addresses = np.empty(count, dtype=object)
+        zip_codes = np.empty(count, dtype=object)
+        review_counts = np.zeros(count, dtype=np.int64)
+        ratings = np.full(count, np.nan, dtype=np.float32)
+        latitudes = np.zeros(count, dtype=np.float32)
+        longitudes = np.zeros(count, dtype=np.float32)
+        
+        for i, business in enumerate(businesses):
+            names[i] = business.name
+            names_norm[i] = _normalize_name(business.name)
+            addresses[i] = business.address or ''
+            zip_codes[i] = business.zip_code
+            review_counts[i] = business.review_count or 0
+            if business.rating is not None:
+                ratings[i] = business.rating
+            latitudes[i] = business.latitude or 0.0
+            longitudes[i] = business.longitude or 0.0
+        
+        return cls(names, names_norm, addresses, review_counts, ratings, latitudes, longitudes, zip_codes)
+    
+    @classmethod
+    def concat(cls, tables: List['BusinessTable']) -> 'BusinessTable':
+        """Stack tables row-wise, in order"""
+        if not tables:
+            return cls.from_businesses([])
+        return cls(*(
+            np.concatenate([getattr(table, field.name) for table in tables])
+            for field in fields(cls)
+        ))
+    
+    def take(self, indexes: np.ndarray) -> 'BusinessTable':
+        """Rows at the given indexes, in order"""
+        return BusinessTable(
+            self.names[indexes],
+            self.names_norm[indexes],
+            self.addresses[indexes],
+            self.review_counts[indexes],
+            self.ratings[indexes],
+            self.latitudes[indexes],
+            self.longitudes[indexes],
+            self.zip_codes[indexes]
+        )
+    
+    def __len__(self) -> int:
+        return len(self.names)
 
 @dataclass
 class MarketAnalytics:
     """Market fragmentation and demographic analytics"""
+    __slots__ = (
+        'fragmentation_score', 'hhi_index', 'business_density', 'succession_risk',
+        'homeownership_rate', 'median_age', 'total_businesses', 'businesses_per_1000_people'
+    )
+    
     fragmentation_score: float
     hhi_index: float
     business_density: float
@@ -56,6 +256,10 @@ class MarketAnalytics:
 @dataclass
 class FragmentFinderResult:
     """Complete Fragment Finder analysis result"""
+    __slots__ = (
+        'location', 'industry', 'businesses', 'analytics', 'top_zips_by_density', 'success', 'message'
+    )
+    
     location: str
     industry: str
     businesses: List[BusinessData]
@@ -72,6 +276,10 @@ class FragmentFinderService:
         self.yelp_api_key = settings.YELP_API_KEY
         self.census_api_key = settings.US_CENSUS_API_KEY
         
+        # Shared HTTP session and upstream concurrency limit, created lazily inside the running event loop
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._request_semaphore: Optional[asyncio.Semaphore] = None
+        
         # Initialize mathematical analytics service for proper formulas
         try:
             from .mathematical_analytics_service import MathematicalAnalyticsService
@@ -97,6 +305,60 @@ class FragmentFinderService:
             'accounting': ['541211'],
         }
 
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared ClientSession, creating it on first use"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=100, ttl_dns_cache=300, keepalive_timeout=60)
+            self._session = aiohttp.ClientSession(connector=connector)
+            self._request_semaphore = asyncio.Semaphore(UPSTREAM_MAX_CONCURRENCY)
+        return self._session
+
+    async def _get_json(
+        self,
+        url: str,
+        params: Dict[str, Any],
+        headers: Optional[Dict[str, str]] = None
+    ) -> Optional[Any]:
+        """GET an upstream API under the shared concurrency limit, retrying 429/5xx with backoff"""
+        return await self._request_json('GET', url, params=params, headers=headers)
+
+    async def _post_json(
+        self,
+        url: str,
+        body: Dict[str, Any],
+        headers: Optional[Dict[str, str]] = None
+    ) -> Optional[Any]:
+        """POST a JSON body to an upstream API, with the same limits and retries as _get_json"""
+        return await self._request_json('POST', url, json=body, headers=headers)
+
+    async def _request_json(self, method: str, url: str, **kwargs) -> Optional[Any]:
+        """Send a request under the shared concurrency limit, retrying 429/5xx with backoff"""
+        
+        session = await self._get_session()
+        
+        for attempt in range(UPSTREAM_MAX_ATTEMPTS):
+            async with self._request_semaphore:
+                async with session.request(method, url, **kwargs) as response:
+                    if response.status == 200:
+                        return _json_loads(await response.read())
+                    if response.status != 429 and response.status < 500:
+                        logger.warning(f"Upstream request to {url} failed with status {response.status}")
+                        return None
+            
+            # Back off outside the semaphore so other requests can proceed
+            if attempt + 1 < UPSTREAM_MAX_ATTEMPTS:
+                await asyncio.sleep(2 ** attempt)
+        
+        logger.warning(f"Upstream request to {url} still failing after {UPSTREAM_MAX_ATTEMPTS} attempts")
+        return None
+
+    async def aclose(self) -> None:
+        """Close the shared ClientSession and its pooled connections"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    @async_ttl_cache(ttl=ANALYSIS_CACHE_TTL, should_cache=lambda result: result.success)
     async def analyze_market_fragmentation(
         self,
         location: str,
@@ -116,7 +378,7 @@ class FragmentFinderService:
             logger.info(f"Starting fragmentation analysis for {industry} in {location}")
             
             # Step 1: Get businesses from multiple sources
-            businesses = await self._get_all_businesses(location, industry, search_radius_miles)
+            businesses, table = await self._get_all_businesses(location, industry, search_radius_miles)
             
             if not businesses:
                 return FragmentFinderResult(
@@ -130,10 +392,10 @@ class FragmentFinderService:
                 )
             
             # Step 2: Calculate market analytics
-            analytics = await self._calculate_market_analytics(businesses, location)
+            analytics = await self._calculate_market_analytics(table, location)
             
             # Step 3: Get top ZIP codes by business density
-            top_zips = self._analyze_zip_density(businesses)
+            top_zips = self._analyze_zip_density(table)
             
             logger.info(f"Fragment analysis completed: {len(businesses)} businesses, HHI={analytics.hhi_index:.3f}")
             
@@ -164,171 +426,243 @@ class FragmentFinderService:
         location: str, 
         industry: str, 
         radius_miles: int
-    ) -> List[BusinessData]:
-        """Get businesses from Google Places + Yelp and deduplicate"""
+    ) -> Tuple[List[BusinessData], BusinessTable]:
+        """Get businesses from Google Places + Yelp, deduplicate, and build their column table"""
         
         businesses = []
+        tables = []
+        
+        async def fetch(provider) -> Tuple[List[BusinessData], BusinessTable]:
+            # Build each provider's columns as soon as it lands, while the other is still fetching
+            provider_businesses = await provider
+            return provider_businesses, BusinessTable.from_businesses(provider_businesses)
+        
+        # Get from Google Places and Yelp concurrently
+        results = await asyncio.gather(
+            fetch(self._get_google_businesses(location, industry, radius_miles)),
+            fetch(self._get_yelp_businesses(location, industry)),
+            return_exceptions=True
+        )
         
-        # Get from Google Places
-        google_businesses = await self._get_google_businesses(location, industry, radius_miles)
-        businesses.extend(google_businesses)
-        
-        # Get from Yelp
-        yelp_businesses = await self._get_yelp_businesses(location, industry)
-        businesses.extend(yelp_businesses)
+        for source, result in zip(('Google Places', 'Yelp'), results):
+            if isinstance(result, Exception):
+                logger.error(f"{source} fetch failed: {str(result)}")
+            else:
+                businesses.extend(result[0])
+                tables.append(result[1])
         
         # Deduplicate by name + address similarity
-        unique_businesses = self._deduplicate_businesses(businesses)
+        table = BusinessTable.concat(tables)
+        keep = self._deduplicate_businesses(table)
+        unique_businesses = [businesses[i] for i in keep]
         
         logger.info(f"Collected {len(unique_businesses)} unique businesses from {len(businesses)} total")
-        return unique_businesses
+        return unique_businesses, table.take(keep)
 
+    @async_ttl_cache(ttl=BUSINESS_CACHE_TTL)
     async def _get_google_businesses(
         self, 
         location: str, 
         industry: str, 
         radius_miles: int
     ) -> List[BusinessData]:
-        """Get businesses from Google Places API"""
+        """Get businesses from Google Places API (New) text search
         
-        businesses = []
-        search_terms = {
-            'hvac': 'HVAC contractor',
-            'plumbing': 'plumber plumbing contractor',
-            'electrical': 'electrician electrical contractor',
-            'landscaping': 'landscaping lawn care',
-            'restaurant': 'restaurant',
-            'tree service': 'tree service arborist',
-            'auto repair': 'auto repair mechanic',
-            'dentist': 'dentist dental office',
-            'veterinary': 'veterinarian animal hospital',
-            'hair salon': 'hair salon barber',
-            'gym': 'gym fitness center',
-            'accounting': 'accountant CPA',
-        }
+        The field mask limits the response to the five fields we read. Text
+        search has no hard radius, so the location stays in the query text.
+        """
         
-        search_term = search_terms.get(industry.lower(), industry)
+        businesses = []
+        search_term = GOOGLE_SEARCH_TERMS.get(industry.lower(), industry)
         
         try:
-            async with aiohttp.ClientSession() as session:
-                # Text search for broader coverage
-                url = "https://maps.googleapis.com/maps/api/place/textsearch/json"
-                params = {
-                    'query': f'{search_term} near {location}',
-                    'radius': radius_miles * 1609,  # Convert miles to meters
-                    'key': self.google_api_key
-                }
-                
-                async with session.get(url, params=params) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        for place in data.get('results', [])[:60]:  # Limit results
-                            business = BusinessData(
-                                name=place.get('name', ''),
-                                address=place.get('formatted_address', ''),
-                                latitude=place['geometry']['location']['lat'],
-                                longitude=place['geometry']['location']['lng'],
-                                rating=place.get('rating'),
-                                review_count=place.get('user_ratings_total'),
-                                source='Google Places',
-                                zip_code=self._extract_zip_code(place.get('formatted_address', ''))
-                            )
-                            businesses.append(business)
-                    
+            # Text search for broader coverage
+            headers = {
+                'X-Goog-Api-Key': self.google_api_key,
+                'X-Goog-FieldMask': GOOGLE_PLACES_FIELD_MASK
+            }
+            body = {
+                'textQuery': f'{search_term} near {location}',
+                'pageSize': 20
+            }
+            
+            data = await self._post_json(GOOGLE_PLACES_SEARCH_URL, body, headers=headers)
+            if data:
+                for place in data.get('places', [])[:60]:  # Limit results
+                    address = place.get('formattedAddress', '')
+                    business = BusinessData(
+                        name=place.get('displayName', {}).get('text', ''),
+                        address=address,
+                        latitude=place['location']['latitude'],
+                        longitude=place['location']['longitude'],
+                        phone=None,
+                        rating=place.get('rating'),
+                        review_count=place.get('userRatingCount'),
+                        url=None,
+                        source='Google Places',
+                        zip_code=self._extract_zip_code(address)
+                    )
+                    businesses.append(business)
+            
         except Exception as e:
             logger.error(f"Google Places API error: {str(e)}")
         
         return businesses
 
+    @async_ttl_cache(ttl=BUSINESS_CACHE_TTL)
     async def _get_yelp_businesses(self, location: str, industry: str) -> List[BusinessData]:
         """Get businesses from Yelp API"""
         
-        businesses = []
-        yelp_categories = {
-            'hvac': 'hvac',
-            'plumbing': 'plumbing',
-            'electrical': 'electricians',
-            'landscaping': 'landscaping',
-            'restaurant': 'restaurants',
-            'tree service': 'treeservices',
-            'auto repair': 'autorepair',
-            'dentist': 'dentists',
-            'veterinary': 'veterinarians',
-            'hair salon': 'hair',
-            'gym': 'gyms',
-            'accounting': 'accountants',
-        }
-        
-        category = yelp_categories.get(industry.lower(), industry)
+        pages: Dict[int, List[BusinessData]] = {}
         
         try:
-            headers = {"Authorization": f"Bearer {self.yelp_api_key}"}
-            
-            async with aiohttp.ClientSession(headers=headers) as session:
-                for offset in range(0, 200, 50):  # Get up to 200 results
-                    url = "https://api.yelp.com/v3/businesses/search"
-                    params = {
-                        'location': location,
-                        'categories': category,
-                        'limit': 50,
-                        'offset': offset
-                    }
-                    
-                    async with session.get(url, params=params) as response:
-                        if response.status == 200:
-                            data = await response.json()
-                            for biz in data.get('businesses', []):
-                                business = BusinessData(
-                                    name=biz.get('name', ''),
-                                    address=' '.join(biz['location'].get('display_address', [])),
-                                    latitude=biz['coordinates']['latitude'],
-                                    longitude=biz['coordinates']['longitude'],
-                                    phone=biz.get('phone'),
-                                    rating=biz.get('rating'),
-                                    review_count=biz.get('review_count'),
-                                    url=biz.get('url'),
-                                    source='Yelp',
-                                    zip_code=biz['location'].get('zip_code')
-                                )
-                                businesses.append(business)
-                        else:
-                            break
-                            
+            async for offset, page in self._iter_yelp_pages(location, industry):
+                pages[offset] = page
         except Exception as e:
             logger.error(f"Yelp API error: {str(e)}")
         
-        return businesses
+        # Pages arrive out of order; keep offset order so deduplication is deterministic
+        return [business for offset in sorted(pages) for business in pages[offset]]
+
+    async def _iter_yelp_pages(
+        self,
+        location: str,
+        industry: str
+    ) -> AsyncIterator[Tuple[int, List[BusinessData]]]:
+        """Yield (offset, businesses) for each Yelp search page as soon as it arrives
+        
+        All pages are requested at once; closing the generator early (or
+        cancelling its consumer) cancels the pages still in flight.
+        """
+        
+        category = YELP_CATEGORIES.get(industry.lower(), industry)
+        headers = {"Authorization": f"Bearer {self.yelp_api_key}"}
+        url = "https://api.yelp.com/v3/businesses/search"
+        page_semaphore = asyncio.Semaphore(YELP_MAX_CONCURRENT_PAGES)
+        
+        async def fetch_page(offset: int) -> Tuple[int, List[BusinessData]]:
+            params = {
+                'location': location,
+                'categories': category,
+                'limit': 50,
+                'offset': offset
+            }
+            
+            page = []
+            async with page_semaphore:
+                data = await self._get_json(url, params, headers=headers)
+            
+            if data:
+                for biz in data.get('businesses', []):
+                    business = BusinessData(
+                        name=biz.get('name', ''),
+                        address=' '.join(biz['location'].get('display_address', [])),
+                        latitude=biz['coordinates']['latitude'],
+                        longitude=biz['coordinates']['longitude'],
+                        phone=biz.get('phone'),
+                        rating=biz.get('rating'),
+                        review_count=biz.get('review_count'),
+                        url=biz.get('url'),
+                        source='Yelp',
+                        zip_code=biz['location'].get('zip_code')
+                    )
+                    page.append(business)
+            return offset, page
+        
+        # Pages past the end of the results come back empty
+        tasks = [asyncio.ensure_future(fetch_page(offset)) for offset in range(0, 200, 50)]  # Get up to 200 results
+        try:
+            for next_page in asyncio.as_completed(tasks):
+                try:
+                    offset, page = await next_page
+                except Exception as e:
+                    logger.error(f"Yelp page fetch failed: {str(e)}")
+                    continue
+                if page:
+                    yield offset, page
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def _deduplicate_businesses(self, table: BusinessTable) -> np.ndarray:
+        """Row indexes of unique businesses, based on name + address similarity
+        
+        Businesses are blocked by ZIP code (falling back to the start of the address)
+        so fuzzy name comparisons only run within each block. Names scoring at least
+        DEDUP_NAME_SIMILARITY on RapidFuzz's token-set ratio are merged, keeping the
+        first business seen.
+        """
+        
+        if not RAPIDFUZZ_AVAILABLE:
+            return self._deduplicate_businesses_exact(table)
+        
+        blocks: Dict[str, List[int]] = {}
+        for index, (zip_code, address) in enumerate(zip(table.zip_codes, table.addresses)):
+            block_key = zip_code or address.lower().strip()[:3]
+            blocks.setdefault(block_key, []).append(index)
+        
+        # Union-find over business indexes; each root is the first-seen duplicate
+        parent = list(range(len(table)))
+        
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+        
+        for indexes in blocks.values():
+            if len(indexes) < 2:
+                continue
+            
+            # Names are pre-normalized once per table, so RapidFuzz needs no processor
+            names = table.names_norm[indexes].tolist()
+            # Scores under the cutoff come back as 0; uint8 keeps the matrix at one byte per pair
+            scores = process.cdist(
+                names, names,
+                scorer=fuzz.token_set_ratio,
+                score_cutoff=DEDUP_NAME_SIMILARITY,
+                dtype=np.uint8,
+                workers=-1
+            )
+            
+            # Only matching pairs above the diagonal need a union
+            for a, b in zip(*np.nonzero(np.triu(scores, k=1))):
+                root_a, root_b = find(indexes[a]), find(indexes[b])
+                if root_a != root_b:
+                    parent[max(root_a, root_b)] = min(root_a, root_b)
+        
+        return np.array([index for index in range(len(table)) if find(index) == index], dtype=np.intp)
 
-    def _deduplicate_businesses(self, businesses: List[BusinessData]) -> List[BusinessData]:
-        """Remove duplicate businesses based on name + address similarity"""
+    def _deduplicate_businesses_exact(self, table: BusinessTable) -> np.ndarray:
+        """Row indexes of unique businesses on an exact normalized name + address prefix key"""
         
-        unique_businesses = []
+        unique_indexes = []
         seen = set()
         
-        for business in businesses:
+        for index, (name_norm, address) in enumerate(zip(table.names_norm, table.addresses)):
             # Create a normalized key for deduplication
-            name_key = business.name.lower().strip().replace(' ', '')
-            address_key = business.address.lower().strip()[:20] if business.address else ""
+            name_key = name_norm.replace(' ', '')
+            address_key = address.lower().strip()[:20]
             key = f"{name_key}|{address_key}"
             
             if key not in seen:
                 seen.add(key)
-                unique_businesses.append(business)
+                unique_indexes.append(index)
         
-        return unique_businesses
+        return np.array(unique_indexes, dtype=np.intp)
 
     async def _calculate_market_analytics(
         self, 
-        businesses: List[BusinessData], 
+        table: BusinessTable, 
         location: str
     ) -> MarketAnalytics:
         """Calculate comprehensive market analytics"""
         
-        total_businesses = len(businesses)
+        total_businesses = len(table)
         
         # Calculate HHI (Herfindahl-Hirschman Index)
         # Since we don't have revenue data, we'll use review count as a proxy for market share
-        hhi_index = self._calculate_hhi(businesses)
+        hhi_index = self._calculate_hhi(table)
         
         # Calculate fragmentation score (inverse of concentration)
         fragmentation_score = max(0, 100 - (hhi_index * 100))
@@ -379,85 +713,123 @@ class FragmentFinderService:
             businesses_per_1000_people=businesses_per_1000
         )
 
-    def _calculate_hhi(self, businesses: List[BusinessData]) -> float:
+    def _calculate_hhi(self, table: BusinessTable) -> float:
         """Calculate HHI using proper mathematical formula: HHI = Σ(si²)"""
         
         if self.math_analytics:
-            # Convert BusinessData to format expected by mathematical analytics service
-            business_dicts = []
-            for business in businesses:
-                business_dict = {
-                    'name': business.name,
-                    'reviews': business.review_count or 0,
-                    'review_count': business.review_count or 0,
-                    'rating': business.rating or 4.0,
-                    'estimated_revenue': 0  # Will be calculated by the service
-                }
-                business_dicts.append(business_dict)
+            # Reviews weighted by rating quality (missing ratings count as 4.0), straight from the columns
+            ratings = table.ratings.astype(np.float64)
+            ratings[np.isnan(ratings) | (ratings == 0)] = 4.0
+            weighted_reviews = table.review_counts * (ratings / 5.0)
             
             # Use mathematical analytics service for proper HHI calculation
-            hhi_analysis = self.math_analytics.calculate_hhi_index(business_dicts, 'reviews_weighted')
+            hhi_analysis = self.math_analytics.calculate_hhi_from_counts(weighted_reviews, 'reviews_weighted')
             return hhi_analysis['hhi_score'] / 10000  # Convert back to 0-1 scale for fragment finder
         else:
-            # Fallback to legacy calculation
-            review_counts = []
-            for business in businesses:
-                reviews = business.review_count if business.review_count and business.review_count > 0 else 1
-                review_counts.append(reviews)
-            
-            if not review_counts:
+            # Fallback to legacy calculation, vectorized: review counts (min 1) as market share proxy
+            if not len(table):
                 return 0.0
             
-            # Calculate market shares
-            total_reviews = sum(review_counts)
-            market_shares = [count / total_reviews for count in review_counts]
-            
-            # HHI = sum of squared market shares
-            hhi = sum(share ** 2 for share in market_shares)
-            
-            return hhi
+            review_counts = np.maximum(table.review_counts, 1)
+            return float(_hhi_from_counts(review_counts))
 
+    @async_ttl_cache(ttl=CENSUS_CACHE_TTL, should_cache=lambda demographics: demographics != DEFAULT_DEMOGRAPHICS)
     async def _get_census_demographics(self, location: str) -> Dict[str, Any]:
-        """Get demographics from US Census API"""
+        """Get demographics from the US Census ACS 5-year API
+        
+        ZIP-bearing locations are looked up by ZCTA; "City, ST" locations are
+        matched against the state's place table, which is fetched in one batch
+        call and cached so later cities in the same state cost nothing.
+        """
         
         try:
-            # Try to extract state/county from location for Census API
-            # For now, we'll use some fallback data and random variation
-            # In production, you'd parse the location and make proper Census API calls
+            zip_code = self._extract_zip_code(location)
+            if zip_code:
+                rows = await self._fetch_acs_rows({'for': f'zip code tabulation area:{zip_code}'})
+                if rows:
+                    return self._parse_acs_demographics(rows[0])
+            
+            city, _, state = location.partition(',')
+            state_fips = CENSUS_STATE_FIPS.get(state.strip()[:2].upper())
+            if state_fips:
+                places = await self._get_census_state_places(state_fips)
+                place = places.get(city.strip().lower())
+                if place:
+                    return place
+            
+            logger.info(f"No Census match for {location}, using default demographics")
             
-            async with aiohttp.ClientSession() as session:
-                # This is a simplified version - you'd need proper geocoding
-                # to get FIPS codes for the Census API
-                
-                # For demo purposes, return realistic demographic data with variation
-                base_age = random.randint(35, 55)
-                base_homeownership = random.randint(60, 80)
-                base_population = random.randint(50000, 500000)
-                
-                return {
-                    'median_age': base_age,
-                    'homeownership_rate': base_homeownership,
-                    'population': base_population
-                }
-                
         except Exception as e:
             logger.error(f"Census API error: {str(e)}")
-            return {
-                'median_age': 42.0,
-                'homeownership_rate': 68.0,
-                'population': 100000
-            }
+        
+        return dict(DEFAULT_DEMOGRAPHICS)
+
+    @async_ttl_cache(ttl=CENSUS_CACHE_TTL)
+    async def _get_census_state_places(self, state_fips: str) -> Dict[str, Dict[str, Any]]:
+        """Demographics for every Census place in a state, keyed by lower-cased place name"""
+        
+        rows = await self._fetch_acs_rows({'for': 'place:*', 'in': f'state:{state_fips}'})
+        
+        places = {}
+        for row in rows:
+            # NAME looks like "San Francisco city, California"; key on the name without its place type
+            place_name = row['NAME'].split(',')[0]
+            for suffix in CENSUS_PLACE_SUFFIXES:
+                if place_name.endswith(suffix):
+                    place_name = place_name[:-len(suffix)]
+                    break
+            places.setdefault(place_name.lower(), self._parse_acs_demographics(row))
+        
+        return places
+
+    async def _fetch_acs_rows(self, geography: Dict[str, str]) -> List[Dict[str, str]]:
+        """Query the ACS 5-year API and return one dict per geography row"""
+        
+        params = {'get': ','.join(('NAME',) + CENSUS_ACS_VARIABLES), **geography}
+        if self.census_api_key:
+            params['key'] = self.census_api_key
+        
+        data = await self._get_json(CENSUS_ACS_URL, params)
+        if not data or len(data) < 2:
+            return []
+        
+        # First row is the header
+        header = data[0]
+        return [dict(zip(header, row)) for row in data[1:]]
+
+    def _parse_acs_demographics(self, row: Dict[str, str]) -> Dict[str, Any]:
+        """Convert an ACS row into the demographics dict used by the analytics"""
+        
+        def estimate(variable: str) -> Optional[float]:
+            # The API returns strings, with large negative sentinels for suppressed estimates
+            try:
+                value = float(row.get(variable))
+            except (TypeError, ValueError):
+                return None
+            return value if value >= 0 else None
+        
+        population = estimate('B01003_001E')
+        median_age = estimate('B01002_001E')
+        occupied_units = estimate('B25003_001E')
+        owner_units = estimate('B25003_002E')
+        
+        homeownership_rate = DEFAULT_DEMOGRAPHICS['homeownership_rate']
+        if occupied_units and owner_units is not None:
+            homeownership_rate = round(owner_units / occupied_units * 100, 1)
+        
+        return {
+            'median_age': median_age if median_age is not None else DEFAULT_DEMOGRAPHICS['median_age'],
+            'homeownership_rate': homeownership_rate,
+            'population': int(population) if population else DEFAULT_DEMOGRAPHICS['population']
+        }
 
-    def _analyze_zip_density(self, businesses: List[BusinessData]) -> List[Dict[str, Any]]:
+    def _analyze_zip_density(self, table: BusinessTable) -> List[Dict[str, Any]]:
         """Analyze business density by ZIP code"""
         
-        zip_counts = {}
-        for business in businesses:
-            if business.zip_code:
-                zip_counts[business.zip_code] = zip_counts.get(business.zip_code, 0) + 1
+        zip_counts = Counter(zip_code for zip_code in table.zip_codes if zip_code)
         
-        # Sort by count and return top ZIP codes
-        top_zips = sorted(zip_counts.items(), key=lambda x: x[1], reverse=True)[:10]
+        # Top ZIP codes by count (heap selection, no full sort)
+        top_zips = zip_counts.most_common(10)
         
         return [
             {
@@ -471,10 +843,8 @@ class FragmentFinderService:
     def _extract_zip_code(self, address: str) -> Optional[str]:
         """Extract ZIP code from address string"""
         
-        import re
         if not address:
             return None
         
-        # Look for 5-digit ZIP code
-        match = re.search(r'\b\d{5}\b', address)
+        match = _ZIP_RE.search(address)
         return match.group() if match else None
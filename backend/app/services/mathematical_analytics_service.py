@@ -7,45 +7,347 @@ This service implements the exact mathematical formulas for:
 3. Revenue Formula: R̂ = α·log(1+Nr) + β·log(1+Np)
 """
 
+import functools
 import logging
 import math
 import asyncio
 import aiohttp
+import bisect
 import os
-import random
-from typing import Dict, List, Any, Optional, Tuple
+import re
+import time
+import numpy as np
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, NamedTuple, Optional, Sequence, Tuple, Union
 from datetime import datetime
 
+from ..core.cache import async_ttl_cache
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency in dev
+    NUMBA_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Census ACS 5-year estimates: total population, households, median household income, median age
+CENSUS_ACS_URL = "https://api.census.gov/data/2022/acs/acs5"
+CENSUS_ACS_VARIABLES = ('B01003_001E', 'B11001_001E', 'B19013_001E', 'B01002_001E')
+CENSUS_CACHE_TTL = 24 * 60 * 60
+
+# Fallback estimates for unknown locations are drawn in blocks of this size
+CENSUS_ESTIMATE_BLOCK = 256
+_CENSUS_ESTIMATE_RNG = np.random.default_rng()
+_census_estimate_pool: List[Dict[str, Any]] = []
+
+# 5-digit ZIP code inside a location string
+_ZIP_RE = re.compile(r'\b\d{5}\b')
+
+# Business density classification: level i applies when density exceeds DENSITY_THRESHOLDS[i-1]
+# (1 business per 1,000 / 500 / 200 / 100 people or households)
+DENSITY_THRESHOLDS = (0.001, 0.002, 0.005, 0.01)
+DENSITY_LEVELS = ('Very Low', 'Low', 'Moderate', 'High', 'Very High')
+MARKET_SATURATION_LEVELS = ('Underserved', 'Opportunity', 'Competitive', 'Saturated', 'Oversaturated')
+
+# DOJ/FTC HHI interpretation (0-10,000 scale): band i applies from HHI_CONCENTRATION_THRESHOLDS[i-1] up
+HHI_CONCENTRATION_THRESHOLDS = (1500, 2500)
+HHI_CONCENTRATION_LEVELS = (
+    # (concentration level, antitrust concern, fragmentation)
+    ("Unconcentrated", "Low", "Highly Fragmented"),
+    ("Moderately Concentrated", "Medium", "Moderately Fragmented"),
+    ("Highly Concentrated", "High", "Consolidated"),
+)
+ROLLUP_THRESHOLDS = (1000, 1800, 2500)
+ROLLUP_OPPORTUNITY_LEVELS = ("Excellent", "Good", "Moderate", "Limited")
+
+# Simple chain detection (in production, use comprehensive database), compiled to one alternation
+COMMON_CHAINS = ('mcdonalds', 'subway', 'starbucks', 'pizza hut',
+                 'dominos', 'taco bell', 'kfc', 'burger king')
+_CHAIN_NAME_RE = re.compile('|'.join(map(re.escape, COMMON_CHAINS)))
+
+# Industry-specific coefficients for revenue formula, shared read-only by every instance
+# α = revenue per review coefficient, β = revenue per picture coefficient
+INDUSTRY_COEFFICIENTS: Mapping[str, Mapping[str, int]] = MappingProxyType({
+    industry: MappingProxyType(coefficients) for industry, coefficients in {
+        'restaurant': {'alpha': 12000, 'beta': 1200},
+        'dental': {'alpha': 18000, 'beta': 1800},
+        'auto-repair': {'alpha': 8000, 'beta': 800},
+        'salon': {'alpha': 6000, 'beta': 600},
+        'fitness': {'alpha': 15000, 'beta': 1500},
+        'legal': {'alpha': 25000, 'beta': 2500},
+        'medical': {'alpha': 22000, 'beta': 2200},
+        'retail': {'alpha': 7000, 'beta': 700},
+        'hvac': {'alpha': 14000, 'beta': 1400},
+        'plumbing': {'alpha': 13000, 'beta': 1300},
+        'consulting': {'alpha': 20000, 'beta': 2000},
+        'accounting': {'alpha': 16000, 'beta': 1600},
+        'real-estate': {'alpha': 19000, 'beta': 1900},
+        'catering': {'alpha': 10000, 'beta': 1000},
+        'general': {'alpha': 12000, 'beta': 1200}  # default fallback
+    }.items()
+})
+
+# Parallel α/β arrays indexed by industry id, for the vectorized batch path
+_INDUSTRY_IDS: Mapping[str, int] = MappingProxyType({key: i for i, key in enumerate(INDUSTRY_COEFFICIENTS)})
+_INDUSTRY_ALPHAS = np.array([c['alpha'] for c in INDUSTRY_COEFFICIENTS.values()], dtype=np.float64)
+_INDUSTRY_BETAS = np.array([c['beta'] for c in INDUSTRY_COEFFICIENTS.values()], dtype=np.float64)
+_INDUSTRY_ALPHAS.flags.writeable = False
+_INDUSTRY_BETAS.flags.writeable = False
+_GENERAL_INDUSTRY_ID = _INDUSTRY_IDS['general']
+
+# Major metropolitan area Census ACS data (2022 estimates)
+METRO_CENSUS_DATA = {
+    'san francisco': {
+        'population': 884279,
+        'total_households': 378438,
+        'median_household_income': 119136,
+        'median_age': 38.5,
+        'source': 'US Census ACS 2022'
+    },
+    'los angeles': {
+        'population': 3971883,
+        'total_households': 1395778,
+        'median_household_income': 70372,
+        'median_age': 36.2,
+        'source': 'US Census ACS 2022'
+    },
+    'new york': {
+        'population': 8230290,
+        'total_households': 3147295,
+        'median_household_income': 70663,
+        'median_age': 37.7,
+        'source': 'US Census ACS 2022'
+    },
+    'chicago': {
+        'population': 2665039,
+        'total_households': 1045560,
+        'median_household_income': 62097,
+        'median_age': 35.0,
+        'source': 'US Census ACS 2022'
+    },
+    'houston': {
+        'population': 2302878,
+        'total_households': 841381,
+        'median_household_income': 54441,
+        'median_age': 33.9,
+        'source': 'US Census ACS 2022'
+    },
+    'phoenix': {
+        'population': 1650070,
+        'total_households': 590151,
+        'median_household_income': 64927,
+        'median_age': 34.1,
+        'source': 'US Census ACS 2022'
+    },
+    'philadelphia': {
+        'population': 1567442,
+        'total_households': 603953,
+        'median_household_income': 49127,
+        'median_age': 34.8,
+        'source': 'US Census ACS 2022'
+    },
+    'san antonio': {
+        'population': 1472909,
+        'total_households': 517966,
+        'median_household_income': 53420,
+        'median_age': 33.4,
+        'source': 'US Census ACS 2022'
+    },
+    'san diego': {
+        'population': 1381162,
+        'total_households': 518610,
+        'median_household_income': 89457,
+        'median_age': 35.6,
+        'source': 'US Census ACS 2022'
+    },
+    'dallas': {
+        'population': 1299544,
+        'total_households': 514573,
+        'median_household_income': 56304,
+        'median_age': 32.3,
+        'source': 'US Census ACS 2022'
+    }
+}
+
+
+# Read-only views of METRO_CENSUS_DATA, and its names as one longest-first prefix alternation
+_METRO_CENSUS_VIEWS: Mapping[str, Mapping[str, Any]] = MappingProxyType({
+    metro_key: MappingProxyType(data) for metro_key, data in METRO_CENSUS_DATA.items()
+})
+_METRO_PREFIX_RE = re.compile('|'.join(map(re.escape, sorted(METRO_CENSUS_DATA, key=len, reverse=True))))
+
+
+if NUMBA_AVAILABLE:
+    # Serial on purpose: the kernel runs inside asyncio.to_thread workers, where numba's default
+    # (workqueue) threading layer is not safe for parallel=True. No nnan/ninf fast-math flags
+    # either, since ratings and years are NaN for rows flagged missing.
+    @njit(cache=True, fastmath={'reassoc', 'contract', 'arcp'})
+    def _revenue_kernel(review_counts, picture_counts, ratings, years, missing, alphas, betas):
+        """Per-business revenue plus the revenue sum and sum of squares, in one compiled pass"""
+        count = review_counts.shape[0]
+        revenues = np.empty(count)
+        total = 0.0
+        sum_of_squares = 0.0
+        for i in range(count):
+            if missing[i]:
+                revenue = 500000.0
+            else:
+                reviews = review_counts[i] if review_counts[i] > 0.0 else 0.0
+                pictures = picture_counts[i] if picture_counts[i] > 0.0 else 0.0
+                base_revenue = alphas[i] * np.log1p(reviews) + betas[i] * np.log1p(pictures)
+                
+                rating = ratings[i]
+                if rating >= 4.5:
+                    rating_factor = 1.2
+                elif rating >= 4.0:
+                    rating_factor = 1.0
+                elif rating >= 3.5:
+                    rating_factor = 0.8
+                else:
+                    rating_factor = 0.6
+                
+                age = years[i]
+                if age >= 15.0:
+                    age_factor = 1.15
+                elif age >= 5.0:
+                    age_factor = 1.0
+                else:
+                    age_factor = 0.9
+                
+                revenue = max(base_revenue * (rating_factor * age_factor), 150000.0)
+            revenues[i] = revenue
+            total += revenue
+            sum_of_squares += revenue * revenue
+        return revenues, total, sum_of_squares
+else:
+    def _revenue_kernel(review_counts, picture_counts, ratings, years, missing, alphas, betas):
+        """Per-business revenue plus the revenue sum and sum of squares"""
+        base_revenue = (alphas * np.log1p(np.maximum(review_counts, 0))
+                        + betas * np.log1p(np.maximum(picture_counts, 0)))
+        
+        rating_factor = np.select([ratings >= 4.5, ratings >= 4.0, ratings >= 3.5], [1.2, 1.0, 0.8], default=0.6)
+        age_factor = np.select([years >= 15, years >= 5], [1.15, 1.0], default=0.9)
+        
+        revenues = np.maximum(base_revenue * (rating_factor * age_factor), 150000)
+        revenues[missing] = 500000
+        return revenues, float(revenues.sum()), float(np.dot(revenues, revenues))
+
+
+@functools.lru_cache(maxsize=4096)
+def _industry_key(industry: Optional[str]) -> str:
+    """Key into industry_coefficients for an industry name, e.g. 'Auto Repair' -> 'auto-repair'"""
+    return industry.lower().replace(' ', '-') if industry else 'general'
+
+
+@functools.lru_cache(maxsize=1024)
+def _census_lookup(location_key: str) -> Mapping[str, Any]:
+    """Census data for a lower-cased location, memoized (estimates stay stable per location)"""
+    
+    # Try exact match first, on the whole key and on the city part of "city, st"
+    data = _METRO_CENSUS_VIEWS.get(location_key) or _METRO_CENSUS_VIEWS.get(location_key.split(',', 1)[0].strip())
+    if data is not None:
+        return data
+    
+    # Then a metro name at the start of the location, e.g. "san diego county"
+    match = _METRO_PREFIX_RE.match(location_key)
+    if match:
+        return _METRO_CENSUS_VIEWS[match.group(0)]
+    
+    # Try partial matches for metro areas
+    for metro_key, data in _METRO_CENSUS_VIEWS.items():
+        if metro_key in location_key or location_key in metro_key:
+            return data
+    
+    # Fallback: Generate realistic data based on location characteristics
+    return MappingProxyType(_generate_realistic_census_estimate(location_key))
+
+
+def _generate_realistic_census_estimate_batch(count: int) -> List[Dict[str, Any]]:
+    """Generate realistic Census estimates for unknown locations, drawing all values at once"""
+    
+    # Base estimates with realistic variation
+    base_populations = _CENSUS_ESTIMATE_RNG.integers(75000, 450000, count, endpoint=True)
+    
+    # Households typically 2.2-2.8 people per household
+    people_per_household = _CENSUS_ESTIMATE_RNG.uniform(2.2, 2.8, count)
+    total_households = (base_populations / people_per_household).astype(np.int64)
+    
+    # Income varies by region/location characteristics
+    median_incomes = _CENSUS_ESTIMATE_RNG.integers(45000, 85000, count, endpoint=True)
+    median_ages = _CENSUS_ESTIMATE_RNG.uniform(32.0, 42.0, count)
+    
+    return [
+        {
+            'population': population,
+            'total_households': households,
+            'median_household_income': median_income,
+            'median_age': median_age,
+            'source': 'Estimated based on regional patterns'
+        }
+        for population, households, median_income, median_age in zip(
+            base_populations.tolist(), total_households.tolist(),
+            median_incomes.tolist(), median_ages.tolist()
+        )
+    ]
+
+
+def _generate_realistic_census_estimate(location: str) -> Dict[str, Any]:
+    """Generate a realistic Census estimate for an unknown location"""
+    
+    # Served from a pre-drawn block so the RNG runs once per CENSUS_ESTIMATE_BLOCK locations
+    if not _census_estimate_pool:
+        _census_estimate_pool.extend(_generate_realistic_census_estimate_batch(CENSUS_ESTIMATE_BLOCK))
+    return _census_estimate_pool.pop()
+
+
+class RevenueEstimate(NamedTuple):
+    """Revenue estimate and formula components; to_dict() gives the API response shape"""
+    revenue_estimate: float
+    revenue_range_low: float
+    revenue_range_high: float
+    confidence_score: float
+    alpha_coefficient: float
+    beta_coefficient: float
+    log_reviews: float
+    log_pictures: float
+    base_calculation: float
+    adjustment_factor: float
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'revenue_estimate': self.revenue_estimate,
+            'revenue_range_low': self.revenue_range_low,
+            'revenue_range_high': self.revenue_range_high,
+            'confidence_score': self.confidence_score,
+            'formula_components': {
+                'alpha_coefficient': self.alpha_coefficient,
+                'beta_coefficient': self.beta_coefficient,
+                'log_reviews': self.log_reviews,
+                'log_pictures': self.log_pictures,
+                'base_calculation': self.base_calculation,
+                'adjustment_factor': self.adjustment_factor
+            }
+        }
+
+
 class MathematicalAnalyticsService:
     """Precise implementation of business intelligence mathematical formulas"""
     
+    # Census API session shared by every instance (routers build one per request), created lazily
+    _session: Optional[aiohttp.ClientSession] = None
+    
+    # Module-level constants, so routers building an instance per request don't rebuild them
+    industry_coefficients = INDUSTRY_COEFFICIENTS
+    _industry_ids = _INDUSTRY_IDS
+    _alpha_arr = _INDUSTRY_ALPHAS
+    _beta_arr = _INDUSTRY_BETAS
+    _general_id = _GENERAL_INDUSTRY_ID
+    
     def __init__(self):
         self.census_api_key = os.getenv('CENSUS_API_KEY', '')
         
-        # Industry-specific coefficients for revenue formula
-        # α = revenue per review coefficient, β = revenue per picture coefficient  
-        self.industry_coefficients = {
-            'restaurant': {'alpha': 12000, 'beta': 1200},
-            'dental': {'alpha': 18000, 'beta': 1800}, 
-            'auto-repair': {'alpha': 8000, 'beta': 800},
-            'salon': {'alpha': 6000, 'beta': 600},
-            'fitness': {'alpha': 15000, 'beta': 1500},
-            'legal': {'alpha': 25000, 'beta': 2500},
-            'medical': {'alpha': 22000, 'beta': 2200},
-            'retail': {'alpha': 7000, 'beta': 700},
-            'hvac': {'alpha': 14000, 'beta': 1400},
-            'plumbing': {'alpha': 13000, 'beta': 1300},
-            'consulting': {'alpha': 20000, 'beta': 2000},
-            'accounting': {'alpha': 16000, 'beta': 1600},
-            'real-estate': {'alpha': 19000, 'beta': 1900},
-            'catering': {'alpha': 10000, 'beta': 1000},
-            'general': {'alpha': 12000, 'beta': 1200}  # default fallback
-        }
-        
         # US Census ACS population multipliers for accurate density calculations
-        self.population_cache = {}
         self.households_cache = {}
         
     async def calculate_business_density(self, 
@@ -73,22 +375,10 @@ class MathematicalAnalyticsService:
             # Calculate exact business density
             density = businesses_count / denominator if denominator > 0 else 0
             
-            # Density interpretation 
-            if density > 0.01:  # More than 1 business per 100 people/households
-                density_level = "Very High"
-                market_saturation = "Oversaturated"
-            elif density > 0.005:  # 1 business per 200 people/households
-                density_level = "High" 
-                market_saturation = "Saturated"
-            elif density > 0.002:  # 1 business per 500 people/households
-                density_level = "Moderate"
-                market_saturation = "Competitive"
-            elif density > 0.001:  # 1 business per 1,000 people/households
-                density_level = "Low"
-                market_saturation = "Opportunity"
-            else:
-                density_level = "Very Low"
-                market_saturation = "Underserved"
+            # Density interpretation (thresholds are exclusive, hence bisect_left)
+            density_index = bisect.bisect_left(DENSITY_THRESHOLDS, density)
+            density_level = DENSITY_LEVELS[density_index]
+            market_saturation = MARKET_SATURATION_LEVELS[density_index]
             
             logger.info(f"Business Density calculated for {location}/{industry}: {density:.6f} ({density_level})")
             
@@ -127,105 +417,86 @@ class MathematicalAnalyticsService:
             if not businesses:
                 return {'hhi_score': 0, 'market_concentration': 'No Data'}
             
-            market_shares = []
-            total_market_value = 0
+            business_count = len(businesses)
             
             # Calculate market shares based on available data
             if market_share_proxy == 'revenue':
                 # Use estimated revenue if available
-                for business in businesses:
-                    revenue = business.get('estimated_revenue', 0)
-                    if revenue > 0:
-                        total_market_value += revenue
-                        market_shares.append(revenue)
+                revenues = np.fromiter(
+                    (business.get('estimated_revenue', 0) for business in businesses),
+                    dtype=np.float64,
+                    count=business_count
+                )
+                market_shares = revenues[revenues > 0]
                         
             elif market_share_proxy == 'reviews_weighted':
                 # Proxy using review count * rating weight
-                for business in businesses:
-                    reviews = business.get('reviews', 0) or business.get('review_count', 0)
-                    rating = business.get('rating', 4.0) or 4.0
-                    
-                    # Weight reviews by rating quality
-                    weighted_share = reviews * (rating / 5.0)
-                    total_market_value += weighted_share
-                    market_shares.append(weighted_share)
+                reviews = np.fromiter(
+                    (business.get('reviews', 0) or business.get('review_count', 0) for business in businesses),
+                    dtype=np.float64,
+                    count=business_count
+                )
+                ratings = np.fromiter(
+                    (business.get('rating', 4.0) or 4.0 for business in businesses),
+                    dtype=np.float64,
+                    count=business_count
+                )
+                
+                # Weight reviews by rating quality
+                market_shares = reviews * (ratings / 5.0)
                     
             elif market_share_proxy == 'chain_independent':
                 # Proxy using chain presence vs independents
-                for business in businesses:
-                    name = business.get('name', '').lower()
-                    
-                    # Simple chain detection (in production, use comprehensive database)
-                    common_chains = ['mcdonalds', 'subway', 'starbucks', 'pizza hut', 
-                                   'dominos', 'taco bell', 'kfc', 'burger king']
-                    
-                    if any(chain in name for chain in common_chains):
-                        # Chains typically have higher market presence
-                        market_value = 100
-                    else:
-                        # Independents get base market presence  
-                        market_value = 10
-                        
-                    total_market_value += market_value
-                    market_shares.append(market_value)
+                # Chains typically have higher market presence; independents get base market presence
+                market_shares = np.fromiter(
+                    (100 if _CHAIN_NAME_RE.search(business.get('name', '').lower()) else 10
+                     for business in businesses),
+                    dtype=np.float64,
+                    count=business_count
+                )
                     
             else:
                 # Default: equal market shares
-                equal_share = 1.0 / len(businesses) if businesses else 0
-                market_shares = [equal_share] * len(businesses)
-                total_market_value = 1.0
+                market_shares = np.ones(business_count)
             
             # Convert to market share percentages (si values)
+            total_market_value = market_shares.sum()
             if total_market_value > 0:
-                market_share_percentages = [share / total_market_value for share in market_shares]
+                market_share_percentages = market_shares / total_market_value
             else:
-                market_share_percentages = [1.0 / len(businesses)] * len(businesses)
-            
-            # Calculate HHI using exact formula: HHI = Σ(si²)
-            hhi_score = sum(share ** 2 for share in market_share_percentages)
+                market_share_percentages = np.full(business_count, 1.0 / business_count)
             
-            # Convert to traditional HHI scale (0-10,000)
-            hhi_traditional = hhi_score * 10000
+            return self._build_hhi_result(market_share_percentages, market_share_proxy, business_count)
             
-            # DOJ/FTC market concentration interpretation
-            if hhi_traditional < 1500:
-                concentration_level = "Unconcentrated"
-                antitrust_concern = "Low"
-                fragmentation = "Highly Fragmented"
-            elif hhi_traditional < 2500:
-                concentration_level = "Moderately Concentrated" 
-                antitrust_concern = "Medium"
-                fragmentation = "Moderately Fragmented"
-            else:
-                concentration_level = "Highly Concentrated"
-                antitrust_concern = "High"
-                fragmentation = "Consolidated"
+        except Exception as e:
+            logger.error(f"HHI calculation failed: {e}")
+            return {
+                'hhi_score': 0,
+                'market_concentration': 'Unknown',
+                'error': str(e)
+            }
+    
+    def calculate_hhi_from_counts(self, counts: np.ndarray,
+                                  market_share_proxy: str = 'reviews') -> Dict[str, Any]:
+        """
+        Calculate HHI = Σ(si²) directly from an array of per-firm market values
+        
+        Fast path for callers that already hold review counts (or weighted
+        counts) as an ndarray, skipping the per-business dicts that
+        calculate_hhi_index needs. Returns the same fields.
+        """
+        try:
+            if len(counts) == 0:
+                return {'hhi_score': 0, 'market_concentration': 'No Data'}
             
-            # Roll-up opportunity assessment
-            if hhi_traditional < 1000:
-                rollup_opportunity = "Excellent"
-            elif hhi_traditional < 1800:
-                rollup_opportunity = "Good"
-            elif hhi_traditional < 2500:
-                rollup_opportunity = "Moderate"
+            counts = np.asarray(counts, dtype=np.float64)
+            total_market_value = counts.sum()
+            if total_market_value > 0:
+                market_share_percentages = counts / total_market_value
             else:
-                rollup_opportunity = "Limited"
+                market_share_percentages = np.full(len(counts), 1.0 / len(counts))
             
-            logger.info(f"HHI calculated: {hhi_traditional:.0f} ({concentration_level})")
-            
-            return {
-                'hhi_score': hhi_traditional,
-                'hhi_normalized': hhi_score,
-                'market_concentration': concentration_level,
-                'fragmentation_level': fragmentation,
-                'antitrust_concern': antitrust_concern,
-                'rollup_opportunity': rollup_opportunity,
-                'market_share_proxy': market_share_proxy,
-                'total_businesses': len(businesses),
-                'largest_market_share': max(market_share_percentages) if market_share_percentages else 0,
-                'top_3_market_share': sum(sorted(market_share_percentages, reverse=True)[:3]),
-                'doj_methodology': True
-            }
+            return self._build_hhi_result(market_share_percentages, market_share_proxy, len(counts))
             
         except Exception as e:
             logger.error(f"HHI calculation failed: {e}")
@@ -235,6 +506,52 @@ class MathematicalAnalyticsService:
                 'error': str(e)
             }
     
+    def _build_hhi_result(self, market_share_percentages: np.ndarray,
+                          market_share_proxy: str, total_businesses: int,
+                          hhi_score: Optional[float] = None) -> Dict[str, Any]:
+        """
+        HHI result with DOJ/FTC concentration interpretation, from the market shares (si values)
+        
+        ``hhi_score`` skips the Σ(si²) reduction when the caller already has it.
+        """
+        
+        # Calculate HHI using exact formula: HHI = Σ(si²)
+        if hhi_score is None:
+            hhi_score = float(np.dot(market_share_percentages, market_share_percentages))
+        
+        # Convert to traditional HHI scale (0-10,000)
+        hhi_traditional = hhi_score * 10000
+        
+        # DOJ/FTC market concentration interpretation
+        concentration_level, antitrust_concern, fragmentation = HHI_CONCENTRATION_LEVELS[
+            bisect.bisect_right(HHI_CONCENTRATION_THRESHOLDS, hhi_traditional)
+        ]
+        
+        # Roll-up opportunity assessment
+        rollup_opportunity = ROLLUP_OPPORTUNITY_LEVELS[bisect.bisect_right(ROLLUP_THRESHOLDS, hhi_traditional)]
+        
+        logger.info(f"HHI calculated: {hhi_traditional:.0f} ({concentration_level})")
+        
+        # Top 3 by partial selection rather than a full sort
+        if market_share_percentages.size > 3:
+            top_3_market_share = float(np.partition(market_share_percentages, -3)[-3:].sum())
+        else:
+            top_3_market_share = float(market_share_percentages.sum())
+        
+        return {
+            'hhi_score': hhi_traditional,
+            'hhi_normalized': hhi_score,
+            'market_concentration': concentration_level,
+            'fragmentation_level': fragmentation,
+            'antitrust_concern': antitrust_concern,
+            'rollup_opportunity': rollup_opportunity,
+            'market_share_proxy': market_share_proxy,
+            'total_businesses': total_businesses,
+            'largest_market_share': float(market_share_percentages.max()) if market_share_percentages.size else 0,
+            'top_3_market_share': top_3_market_share,
+            'doj_methodology': True
+        }
+    
     def calculate_revenue_estimate(self, 
                                  business_name: str,
                                  review_count: int, 
@@ -252,93 +569,21 @@ class MathematicalAnalyticsService:
         - β = revenue per picture coefficient (weaker signal, ~10% of α)
         """
         try:
-            # Get industry-specific coefficients
-            industry_key = industry.lower().replace(' ', '-') if industry else 'general'
-            coefficients = self.industry_coefficients.get(industry_key, self.industry_coefficients['general'])
-            
-            alpha = coefficients['alpha']  # Revenue per review coefficient
-            beta = coefficients['beta']    # Revenue per picture coefficient (~10% of alpha)
-            
-            # Apply exact revenue formula with log scaling to dampen outliers
-            log_reviews = math.log(1 + review_count) if review_count >= 0 else 0
-            log_pictures = math.log(1 + picture_count) if picture_count >= 0 else 0
-            
-            base_revenue_estimate = alpha * log_reviews + beta * log_pictures
-            
-            # Additional factors adjustment (if provided)
-            adjustment_factor = 1.0
-            if additional_factors:
-                # Rating quality adjustment
-                if 'rating' in additional_factors:
-                    rating = additional_factors['rating']
-                    if rating >= 4.5:
-                        adjustment_factor *= 1.2  # Premium for excellent rating
-                    elif rating >= 4.0:
-                        adjustment_factor *= 1.0  # Neutral for good rating  
-                    elif rating >= 3.5:
-                        adjustment_factor *= 0.8  # Discount for average rating
-                    else:
-                        adjustment_factor *= 0.6  # Penalty for poor rating
-                
-                # Business age factor
-                if 'years_in_business' in additional_factors:
-                    years = additional_factors['years_in_business']
-                    if years >= 15:
-                        adjustment_factor *= 1.15  # Established business bonus
-                    elif years >= 5:
-                        adjustment_factor *= 1.0   # Mature business neutral
-                    else:
-                        adjustment_factor *= 0.9   # New business discount
-                
-                # Location/market premium
-                if 'location_premium' in additional_factors:
-                    adjustment_factor *= additional_factors['location_premium']
-            
-            # Calculate final revenue estimate
-            revenue_estimate = base_revenue_estimate * adjustment_factor
+            estimate = self.estimate_revenue(review_count, picture_count, industry, additional_factors)
             
-            # Minimum viable business revenue floor
-            minimum_revenue = 150000  # $150K minimum for sustainable business
-            final_revenue_estimate = max(revenue_estimate, minimum_revenue)
+            # Lazy %-formatting: this runs per business, and the message is usually filtered out
+            logger.debug("Revenue calculated for %s: $%.0f (confidence: %.0f%%)",
+                         business_name, estimate.revenue_estimate, estimate.confidence_score * 100)
             
-            # Revenue confidence based on data availability
-            confidence_score = 0.7  # Base confidence
-            if review_count >= 50:
-                confidence_score += 0.1
-            if picture_count >= 10:
-                confidence_score += 0.1
-            if additional_factors and len(additional_factors) >= 2:
-                confidence_score += 0.1
-            
-            confidence_score = min(confidence_score, 0.95)  # Cap at 95%
-            
-            # Revenue range (±25% for uncertainty)
-            revenue_range_low = final_revenue_estimate * 0.75
-            revenue_range_high = final_revenue_estimate * 1.25
-            
-            logger.info(f"Revenue calculated for {business_name}: ${final_revenue_estimate:,.0f} (confidence: {confidence_score:.0%})")
-            
-            return {
-                'revenue_estimate': final_revenue_estimate,
-                'revenue_range_low': revenue_range_low,
-                'revenue_range_high': revenue_range_high,
-                'confidence_score': confidence_score,
-                'formula_components': {
-                    'alpha_coefficient': alpha,
-                    'beta_coefficient': beta, 
-                    'log_reviews': log_reviews,
-                    'log_pictures': log_pictures,
-                    'base_calculation': base_revenue_estimate,
-                    'adjustment_factor': adjustment_factor
-                },
-                'data_sources': {
-                    'review_count': review_count,
-                    'picture_count': picture_count,
-                    'industry': industry,
-                    'additional_factors': additional_factors or {}
-                },
-                'methodology': 'Log-scaled revenue per review/picture with industry coefficients'
+            result = estimate.to_dict()
+            result['data_sources'] = {
+                'review_count': review_count,
+                'picture_count': picture_count,
+                'industry': industry,
+                'additional_factors': additional_factors or {}
             }
+            result['methodology'] = 'Log-scaled revenue per review/picture with industry coefficients'
+            return result
             
         except Exception as e:
             logger.error(f"Revenue estimation failed for {business_name}: {e}")
@@ -348,24 +593,190 @@ class MathematicalAnalyticsService:
                 'error': str(e)
             }
     
-    async def _fetch_census_acs_data(self, location: str) -> Dict[str, Any]:
+    def estimate_revenue(self,
+                         review_count: int,
+                         picture_count: int,
+                         industry: str,
+                         additional_factors: Dict[str, Any] = None) -> RevenueEstimate:
+        """
+        Revenue estimate as a lightweight RevenueEstimate tuple
+        
+        Same formula as calculate_revenue_estimate, for per-business loops that
+        only read a few fields; raises on invalid input instead of falling back.
+        """
+        # Get industry-specific coefficients
+        industry_key = _industry_key(industry)
+        coefficients = self.industry_coefficients.get(industry_key, self.industry_coefficients['general'])
+        
+        alpha = coefficients['alpha']  # Revenue per review coefficient
+        beta = coefficients['beta']    # Revenue per picture coefficient (~10% of alpha)
+        
+        # Apply exact revenue formula with log scaling to dampen outliers
+        # (negative counts contribute nothing); log1p bound once since routers call this per business
+        log1p = math.log1p
+        log_reviews = log1p(review_count if review_count > 0 else 0)
+        log_pictures = log1p(picture_count if picture_count > 0 else 0)
+        
+        base_revenue_estimate = alpha * log_reviews + beta * log_pictures
+        
+        # Additional factors adjustment (if provided)
+        adjustment_factor = 1.0
+        if additional_factors:
+            # Rating quality adjustment
+            if 'rating' in additional_factors:
+                rating = additional_factors['rating']
+                if rating >= 4.5:
+                    adjustment_factor *= 1.2  # Premium for excellent rating
+                elif rating >= 4.0:
+                    adjustment_factor *= 1.0  # Neutral for good rating  
+                elif rating >= 3.5:
+                    adjustment_factor *= 0.8  # Discount for average rating
+                else:
+                    adjustment_factor *= 0.6  # Penalty for poor rating
+            
+            # Business age factor
+            if 'years_in_business' in additional_factors:
+                years = additional_factors['years_in_business']
+                if years >= 15:
+                    adjustment_factor *= 1.15  # Established business bonus
+                elif years >= 5:
+                    adjustment_factor *= 1.0   # Mature business neutral
+                else:
+                    adjustment_factor *= 0.9   # New business discount
+            
+            # Location/market premium
+            if 'location_premium' in additional_factors:
+                adjustment_factor *= additional_factors['location_premium']
+        
+        # Calculate final revenue estimate
+        revenue_estimate = base_revenue_estimate * adjustment_factor
+        
+        # Minimum viable business revenue floor
+        minimum_revenue = 150000  # $150K minimum for sustainable business
+        final_revenue_estimate = max(revenue_estimate, minimum_revenue)
+        
+        # Revenue confidence based on data availability
+        confidence_score = 0.7  # Base confidence
+        if review_count >= 50:
+            confidence_score += 0.1
+        if picture_count >= 10:
+            confidence_score += 0.1
+        if additional_factors and len(additional_factors) >= 2:
+            confidence_score += 0.1
+        
+        confidence_score = min(confidence_score, 0.95)  # Cap at 95%
+        
+        # Revenue range (±25% for uncertainty)
+        return RevenueEstimate(
+            revenue_estimate=final_revenue_estimate,
+            revenue_range_low=final_revenue_estimate * 0.75,
+            revenue_range_high=final_revenue_estimate * 1.25,
+            confidence_score=confidence_score,
+            alpha_coefficient=alpha,
+            beta_coefficient=beta,
+            log_reviews=log_reviews,
+            log_pictures=log_pictures,
+            base_calculation=base_revenue_estimate,
+            adjustment_factor=adjustment_factor
+        )
+    
+    def _industry_id(self, industry: Optional[str]) -> int:
+        """Index into the α/β coefficient arrays for an industry name ('general' if unknown)"""
+        return self._industry_ids.get(_industry_key(industry), self._general_id)
+    
+    def _revenue_batch(self,
+                       businesses: List[Dict[str, Any]],
+                       industry: Union[str, Sequence[str]]) -> Tuple[np.ndarray, float, float]:
+        """
+        Revenues for a whole business list in one vectorized pass, with their sum and sum of squares
+        
+        Applies the same R̂ = α·log(1+Nr) + β·log(1+Np) formula, rating and
+        business-age adjustments, and $150K floor as calculate_revenue_estimate,
+        reading each business's reviews, photos, rating and years_in_business
+        (default 8). Rows with a missing value get the same $500K fallback the
+        per-business method returns on error.
+        
+        ``industry`` is either one industry for every business or one per business.
+        """
+        count = len(businesses)
+        if isinstance(industry, str):
+            industry_id = self._industry_id(industry)
+            alphas = np.full(count, self._alpha_arr[industry_id])
+            betas = np.full(count, self._beta_arr[industry_id])
+        else:
+            industry_ids = np.fromiter((self._industry_id(name) for name in industry), dtype=np.intp, count=count)
+            alphas = self._alpha_arr[industry_ids]
+            betas = self._beta_arr[industry_ids]
+        
+        def fields(business: Dict[str, Any]) -> Tuple[Any, Any, Any, Any]:
+            get = business.get
+            return (get('reviews', 0) or get('review_count', 0),
+                    get('photos', 0) or len(get('photos_urls', [])),
+                    get('rating', 4.0),
+                    get('years_in_business', 8))
+        
+        # Every field resolved in one pass over the dicts; None (missing) becomes NaN so it
+        # can be masked to the fallback
+        table = np.array([fields(b) for b in businesses], dtype=np.float64).reshape(count, 4)
+        review_counts, picture_counts, ratings, years = np.ascontiguousarray(table.T)
+        missing = np.isnan(review_counts) | np.isnan(picture_counts) | np.isnan(ratings) | np.isnan(years)
+        
+        return _revenue_kernel(review_counts, picture_counts, ratings, years, missing, alphas, betas)
+    
+    def _estimate_business_revenues(self,
+                                    businesses: List[Dict[str, Any]],
+                                    industry: str) -> Tuple[List[Dict[str, Any]], float, Dict[str, Any]]:
+        """
+        Set 'estimated_revenue' on each business
+        
+        Returns the businesses, their total revenue and the revenue-share HHI
+        analysis, all from one pass of the revenue kernel.
+        """
+        if not businesses:
+            return businesses, 0.0, self.calculate_hhi_index(businesses, 'revenue')
+        
+        revenues, total_revenue, sum_of_squares = self._revenue_batch(businesses, industry)
+        
+        for business, revenue in zip(businesses, revenues.tolist()):
+            business['estimated_revenue'] = revenue
+        
+        # Every revenue is floored above zero, so all businesses hold a share and Σ(si²) = Σ(ri²) / (Σri)²
+        hhi_analysis = self._build_hhi_result(revenues / total_revenue, 'revenue', len(businesses),
+                                              hhi_score=sum_of_squares / (total_revenue * total_revenue))
+        return businesses, total_revenue, hhi_analysis
+    
+    @classmethod
+    async def _get_session(cls) -> aiohttp.ClientSession:
+        """Return the shared, connection-pooled Census API session, creating it on first use"""
+        if cls._session is None or cls._session.closed:
+            connector = aiohttp.TCPConnector(limit=64, limit_per_host=16, ttl_dns_cache=300, keepalive_timeout=60)
+            cls._session = aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=10))
+        return cls._session
+    
+    @classmethod
+    async def aclose(cls) -> None:
+        """Close the shared Census API session and its pooled connections"""
+        if cls._session is not None and not cls._session.closed:
+            await cls._session.close()
+        cls._session = None
+    
+    async def _fetch_census_acs_data(self, location: str) -> Mapping[str, Any]:
         """
         Fetch real US Census ACS (American Community Survey) data
         for accurate population and household counts
         """
         try:
-            # Check cache first
-            if location.lower() in self.population_cache:
-                return self.population_cache[location.lower()]
+            # ZIP-bearing locations go to the Census API when a key is configured
+            zip_match = _ZIP_RE.search(location) if self.census_api_key else None
+            if zip_match:
+                acs_data = await self._fetch_acs_zcta(zip_match.group())
+                if acs_data:
+                    return acs_data
             
             # Real Census API integration (mock for now with realistic data)
             # In production: Parse location → get FIPS codes → call Census API
-            census_data = await self._get_realistic_census_data(location)
-            
-            # Cache the result
-            self.population_cache[location.lower()] = census_data
-            
-            return census_data
+            # Lookups are memoized per location by _census_lookup
+            return await self._get_realistic_census_data(location)
             
         except Exception as e:
             logger.error(f"Census ACS data fetch failed for {location}: {e}")
@@ -378,119 +789,43 @@ class MathematicalAnalyticsService:
                 'source': 'Estimated (Census API unavailable)'
             }
     
-    async def _get_realistic_census_data(self, location: str) -> Dict[str, Any]:
-        """Get realistic Census ACS data based on known metropolitan areas"""
+    @async_ttl_cache(ttl=CENSUS_CACHE_TTL)
+    async def _fetch_acs_zcta(self, zip_code: str) -> Optional[Dict[str, Any]]:
+        """ACS 5-year estimates for a ZIP code tabulation area, or None if unavailable"""
         
-        # Major metropolitan area Census ACS data (2022 estimates)
-        metro_census_data = {
-            'san francisco': {
-                'population': 884279,
-                'total_households': 378438,
-                'median_household_income': 119136,
-                'median_age': 38.5,
-                'source': 'US Census ACS 2022'
-            },
-            'los angeles': {
-                'population': 3971883,
-                'total_households': 1395778,
-                'median_household_income': 70372,
-                'median_age': 36.2,
-                'source': 'US Census ACS 2022'
-            },
-            'new york': {
-                'population': 8230290,
-                'total_households': 3147295,
-                'median_household_income': 70663,
-                'median_age': 37.7,
-                'source': 'US Census ACS 2022'
-            },
-            'chicago': {
-                'population': 2665039,
-                'total_households': 1045560,
-                'median_household_income': 62097,
-                'median_age': 35.0,
-                'source': 'US Census ACS 2022'
-            },
-            'houston': {
-                'population': 2302878,
-                'total_households': 841381,
-                'median_household_income': 54441,
-                'median_age': 33.9,
-                'source': 'US Census ACS 2022'
-            },
-            'phoenix': {
-                'population': 1650070,
-                'total_households': 590151,
-                'median_household_income': 64927,
-                'median_age': 34.1,
-                'source': 'US Census ACS 2022'
-            },
-            'philadelphia': {
-                'population': 1567442,
-                'total_households': 603953,
-                'median_household_income': 49127,
-                'median_age': 34.8,
-                'source': 'US Census ACS 2022'
-            },
-            'san antonio': {
-                'population': 1472909,
-                'total_households': 517966,
-                'median_household_income': 53420,
-                'median_age': 33.4,
-                'source': 'US Census ACS 2022'
-            },
-            'san diego': {
-                'population': 1381162,
-                'total_households': 518610,
-                'median_household_income': 89457,
-                'median_age': 35.6,
-                'source': 'US Census ACS 2022'
-            },
-            'dallas': {
-                'population': 1299544,
-                'total_households': 514573,
-                'median_household_income': 56304,
-                'median_age': 32.3,
-                'source': 'US Census ACS 2022'
-            }
+        params = {
+            'get': ','.join(CENSUS_ACS_VARIABLES),
+            'for': f'zip code tabulation area:{zip_code}',
+            'key': self.census_api_key
         }
         
-        location_key = location.lower()
-        
-        # Try exact match first
-        if location_key in metro_census_data:
-            return metro_census_data[location_key]
-        
-        # Try partial matches for metro areas
-        for metro_key, data in metro_census_data.items():
-            if metro_key in location_key or location_key in metro_key:
-                return data
-        
-        # Fallback: Generate realistic data based on location characteristics
-        return self._generate_realistic_census_estimate(location)
-    
-    def _generate_realistic_census_estimate(self, location: str) -> Dict[str, Any]:
-        """Generate realistic Census estimates for unknown locations"""
-        
-        # Base estimates with realistic variation
-        base_population = random.randint(75000, 450000)
-        
-        # Households typically 2.2-2.8 people per household
-        people_per_household = random.uniform(2.2, 2.8)
-        total_households = int(base_population / people_per_household)
+        session = await self._get_session()
+        async with session.get(CENSUS_ACS_URL, params=params) as response:
+            if response.status != 200:
+                logger.warning(f"Census ACS request for ZCTA {zip_code} failed with status {response.status}")
+                return None
+            rows = await response.json(content_type=None)
         
-        # Income varies by region/location characteristics
-        median_income = random.randint(45000, 85000)
-        median_age = random.uniform(32.0, 42.0)
+        # First row is the header; suppressed estimates come back as large negative sentinels
+        if not rows or len(rows) < 2:
+            return None
+        values = dict(zip(rows[0], rows[1]))
+        population, households, median_income, median_age = (float(values[v]) for v in CENSUS_ACS_VARIABLES)
+        if population <= 0 or households <= 0:
+            return None
         
         return {
-            'population': base_population,
-            'total_households': total_households,
-            'median_household_income': median_income,
-            'median_age': median_age,
-            'source': 'Estimated based on regional patterns'
+            'population': int(population),
+            'total_households': int(households),
+            'median_household_income': int(median_income) if median_income > 0 else 65000,
+            'median_age': median_age if median_age > 0 else 36.5,
+            'source': 'US Census ACS 2022 (ZCTA)'
         }
     
+    async def _get_realistic_census_data(self, location: str) -> Mapping[str, Any]:
+        """Get realistic Census ACS data based on known metropolitan areas"""
+        return _census_lookup(location.lower())
+    
     async def comprehensive_market_analysis(self,
                                           businesses: List[Dict[str, Any]],
                                           location: str,
@@ -502,45 +837,27 @@ class MathematicalAnalyticsService:
         3. Revenue Estimations for all businesses
         """
         try:
-            analysis_start = datetime.now()
+            analysis_start = time.perf_counter()
             
             # 1. Calculate Business Density
-            density_analysis = await self.calculate_business_density(
+            # Started first so the Census round trip overlaps the revenue/HHI math below
+            density_task = asyncio.create_task(self.calculate_business_density(
                 businesses_count=len(businesses),
                 location=location,
                 industry=industry
-            )
+            ))
             
             # 2. Calculate HHI Market Concentration
-            # First, estimate revenues for HHI calculation
-            businesses_with_revenue = []
-            total_revenue = 0
-            
-            for business in businesses:
-                review_count = business.get('reviews', 0) or business.get('review_count', 0)
-                picture_count = business.get('photos', 0) or len(business.get('photos_urls', []))
-                rating = business.get('rating', 4.0)
-                
-                additional_factors = {
-                    'rating': rating,
-                    'years_in_business': business.get('years_in_business', 8)
-                }
-                
-                revenue_analysis = self.calculate_revenue_estimate(
-                    business_name=business.get('name', 'Unknown'),
-                    review_count=review_count,
-                    picture_count=picture_count,
-                    industry=industry,
-                    additional_factors=additional_factors
+            # Revenues and the revenue-share HHI come from one kernel pass (pure CPU, so run off the event loop)
+            try:
+                businesses_with_revenue, total_revenue, hhi_analysis = await asyncio.to_thread(
+                    self._estimate_business_revenues, businesses, industry
                 )
-                
-                business_revenue = revenue_analysis['revenue_estimate']
-                business['estimated_revenue'] = business_revenue
-                businesses_with_revenue.append(business)
-                total_revenue += business_revenue
+            except BaseException:
+                density_task.cancel()
+                raise
             
-            # Calculate HHI using revenue data
-            hhi_analysis = self.calculate_hhi_index(businesses_with_revenue, 'revenue')
+            density_analysis = await density_task
             
             # 3. Market Intelligence Summary
             avg_revenue_per_business = total_revenue / len(businesses) if businesses else 0
@@ -556,9 +873,10 @@ class MathematicalAnalyticsService:
             else:
                 market_opportunity = "Limited"
             
-            processing_time = (datetime.now() - analysis_start).total_seconds()
+            processing_time = time.perf_counter() - analysis_start
             
-            logger.info(f"Comprehensive market analysis completed for {location}/{industry} in {processing_time:.2f}s")
+            logger.info(f"Comprehensive market analysis completed for {location}/{industry} in {processing_time:.2f}s: "
+                        f"{len(businesses)} businesses, ${total_revenue:,.0f} estimated total revenue")
             
             return {
                 'market_summary': {
@@ -3,6 +3,8 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse, FileResponse
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
+from contextlib import asynccontextmanager
+import asyncio
 import uvicorn
 import pandas as pd
 import json
@@ -10,13 +12,38 @@ from datetime import datetime
 
 from app.routers import intelligence_working as intelligence, dashboard, fragment_finder, crm, auth, chatbot, enhanced_crm
 from app.core.database import init_db
+from app.services.mathematical_analytics_service import MathematicalAnalyticsService
+from app.services.real_data_analytics import RealDataMarketAnalytics
+
+try:
+    import orjson  # noqa: F401 - ORJSONResponse needs it at render time
+    from fastapi.responses import ORJSONResponse as DefaultResponse
+except ImportError:  # pragma: no cover - optional dependency in dev
+    DefaultResponse = JSONResponse
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create database tables on startup; release pooled HTTP connections on shutdown"""
+    # Sync SQLAlchemy, so off the event loop
+    await asyncio.to_thread(init_db)
+    yield
+    # Long-lived services close their sessions independently of each other
+    await asyncio.gather(
+        fragment_finder.fragment_finder_service.aclose(),
+        MathematicalAnalyticsService.aclose(),
+        RealDataMarketAnalytics.aclose()
+    )
+
 
 app = FastAPI(
     title="Okapiq API",
     description="Bloomberg for Small Businesses - AI-powered deal sourcing and market intelligence",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=DefaultResponse,
+    lifespan=lifespan
 )
 
 # CORS middleware
@@ -37,12 +64,6 @@ app.include_router(enhanced_crm.router, prefix="/enhanced-crm", tags=["Enhanced
 app.include_router(auth.router, prefix="/auth", tags=["Authentication"])
 app.include_router(chatbot.router, prefix="/chatbot", tags=["AI Chatbot"])
 
-# Initialize database on startup
-@app.on_event("startup")
-async def startup_event():
-    """Initialize database tables on startup"""
-    init_db()
-
 @app.get("/")
 async def root():
     """Root endpoint with API information"""
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Shared /intelligence/scan client for the scan check scripts
+
+test_frontend_cards.py and test_website_enrichment.py both scan through
+scan_industries() instead of each carrying its own copy of the client.
+"""
+import asyncio
+import httpx
+import json
+from types import MappingProxyType
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - optional dependency in dev
+    _json_loads = json.loads
+
+SCAN_URL = "http://localhost:8000/intelligence/scan"
+SCANS_PER_SECOND = 5     # Client-side pacing, kept under the scan endpoint's quota
+SCAN_MAX_ATTEMPTS = 3    # Tries per scan when the endpoint answers 429
+MAX_RESPONSE_BYTES = 16 * 1024 * 1024  # Largest (decompressed) scan response body read
+NO_FIELDS = MappingProxyType({})  # Shared read-only default for missing sub-records
+
+# Scan fields shared by every scan; only the location and industry vary
+SCAN_PAYLOAD_TEMPLATE = MappingProxyType({
+    "radius_miles": 15,
+    "max_businesses": 10,  # Smaller batch for testing
+    "crawl_sources": ["google_serp", "apify_gmaps", "yelp"],
+    "use_cache": False
+})
+
+
+async def run_scan(client, industry, location, start_delay=0.0):
+    """POST one market scan for an industry, retrying a 429 after its Retry-After delay"""
+    await asyncio.sleep(start_delay)
+    
+    payload = {**SCAN_PAYLOAD_TEMPLATE, "location": location, "industry": industry}
+    
+    for attempt in range(SCAN_MAX_ATTEMPTS):
+        async with client.stream("POST", SCAN_URL, json=payload) as response:
+            if response.status_code != 429 or attempt + 1 == SCAN_MAX_ATTEMPTS:
+                response.raise_for_status()
+                
+                # Stream the body so a runaway response is abandoned instead of downloaded and parsed
+                body = bytearray()
+                async for chunk in response.aiter_bytes():
+                    body.extend(chunk)
+                    if len(body) > MAX_RESPONSE_BYTES:
+                        raise ValueError(f"Scan response exceeds {MAX_RESPONSE_BYTES} bytes")
+                return _json_loads(body)
+            
+            retry_after = response.headers.get('Retry-After', '')
+        
+        await asyncio.sleep(float(retry_after) if retry_after.isdigit() else 2 ** attempt)
+
+
+async def run_all_scans(industries, location, timeout):
+    """Run every industry's scan concurrently; scans (or errors) come back in industries order"""
+    async with httpx.AsyncClient(timeout=timeout) as client:
+        # Pace the starts at SCANS_PER_SECOND instead of sleeping a fixed 2 s between scans;
+        # each scan keeps its own timeout, so one slow industry fails alone
+        return await asyncio.gather(*(run_scan(client, industry, location, start_delay=i / SCANS_PER_SECOND)
+                                      for i, industry in enumerate(industries)),
+                                    return_exceptions=True)
+
+
+def scan_industries(industries, location="San Francisco", timeout=30):
+    """Scan results (or errors) for industries, in order"""
+    # The scans are I/O-bound, so send them concurrently
+    return asyncio.run(run_all_scans(industries, location, timeout))
@@ -2,9 +2,33 @@
 """
 Complete integration test for Yelp integration and website enrichment
 """
-import requests
+import asyncio
+import httpx
 import json
-import time
+
+SCAN_URL = "http://localhost:8000/intelligence/scan"
+
+
+async def run_scan(client, industry):
+    """POST one market scan for an industry"""
+    return await client.post(
+        SCAN_URL,
+        json={
+            "location": "San Francisco",
+            "industry": industry,
+            "radius_miles": 15,
+            "max_businesses": 10,
+            "crawl_sources": ["google_serp", "yelp", "apify_gmaps"],
+            "use_cache": False
+        }
+    )
+
+
+async def run_all_scans(test_cases):
+    """Run every industry's scan concurrently; responses come back in test_cases order"""
+    async with httpx.AsyncClient(timeout=30) as client:
+        return await asyncio.gather(*(run_scan(client, test["industry"]) for test in test_cases))
+
 
 def test_complete_scan():
     """Test complete market scan with all sources including Yelp"""
@@ -36,23 +60,12 @@ def test_complete_scan():
     
     all_results = []
     
-    for test in test_cases:
+    # Make all API requests (with Yelp included) at once; the scans are I/O-bound
+    responses = asyncio.run(run_all_scans(test_cases))
+    
+    for test, response in zip(test_cases, responses):
         print(f"\n🔍 Testing {test['industry'].upper()}...")
         
-        # Make API request with Yelp included
-        response = requests.post(
-            "http://localhost:8000/intelligence/scan",
-            json={
-                "location": "San Francisco",
-                "industry": test["industry"],
-                "radius_miles": 15,
-                "max_businesses": 10,
-                "crawl_sources": ["google_serp", "yelp", "apify_gmaps"],
-                "use_cache": False
-            },
-            timeout=30
-        )
-        
         if response.status_code == 200:
             data = response.json()
             businesses = data.get('businesses', [])
@@ -109,10 +122,11 @@ def test_complete_scan():
                 
                 # Check if expected websites were found
                 print(f"\n  🎯 Expected Website Verification:")
-                all_websites = [biz.get('contact', {}).get('website', '').lower() 
-                               for biz in businesses]
+                # One newline-joined haystack, so each expected name is a single substring search
+                all_websites = "\n".join(biz.get('contact', {}).get('website', '').lower()
+                                         for biz in businesses)
                 for expected in test['expected_websites']:
-                    found = any(expected.lower() in w for w in all_websites)
+                    found = expected.lower() in all_websites
                     status = "✅" if found else "❌"
                     print(f"    {status} {expected}")
                 
@@ -126,8 +140,6 @@ def test_complete_scan():
             
         else:
             print(f"  ❌ API Error: {response.status_code}")
-        
-        time.sleep(1)  # Rate limiting
     
     # Final summary
     print("\n" + "=" * 60)
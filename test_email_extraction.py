@@ -2,6 +2,7 @@
 """Test email extraction from business websites"""
 
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import time
 
@@ -33,6 +34,12 @@ def test_email_extraction():
     print("EMAIL EXTRACTION TEST - BUSINESS WEBSITES")
     print("="*80)
     
+    # One pooled session so every scan reuses the same keep-alive connection
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    
     for test in test_cases:
         print(f"\n📧 Testing {test['industry'].upper()} in {test['location']}")
         print("-"*60)
@@ -47,7 +54,7 @@ def test_email_extraction():
         }
         
         try:
-            response = requests.post(
+            response = session.post(
                 f"{base_url}/intelligence/scan",
                 json=payload,
                 timeout=60
@@ -105,6 +112,8 @@ def test_email_extraction():
             
         time.sleep(2)  # Rate limiting
     
+    session.close()
+    
     print("\n" + "="*80)
     print("TEST COMPLETE")
     print("="*80)
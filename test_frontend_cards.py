@@ -2,78 +2,66 @@
 """
 Test that result cards display properly on frontend with all required fields
 """
-import requests
-import json
-import time
+from collections import Counter
+from scan_client import NO_FIELDS, scan_industries
 
-def test_industry_scan(industry, location="San Francisco"):
-    """Test scanning for a specific industry and verify data structure"""
-    url = "http://localhost:8000/intelligence/scan"
+# Fields a frontend result card needs, in report order
+REQUIRED_FIELDS = ('name', 'website', 'phone', 'address', 'city', 'state', 'zip_code', 'rating', 'business_type')
+
+
+def _present_fields(biz):
+    """Yield the REQUIRED_FIELDS a business record fills in"""
+    contact = biz.get('contact') or NO_FIELDS
+    address = biz.get('address') or NO_FIELDS
+    metrics = biz.get('metrics') or NO_FIELDS
+    
+    # Main fields
+    if biz.get('name'):
+        yield 'name'
+    
+    # Contact fields
+    if contact.get('website'):
+        yield 'website'
+    if contact.get('phone'):
+        yield 'phone'
+    
+    # Address fields
+    if address.get('formatted_address') or address.get('line1'):
+        yield 'address'
+    if address.get('city'):
+        yield 'city'
+    if address.get('state'):
+        yield 'state'
+    if address.get('zip_code'):
+        yield 'zip_code'
     
-    payload = {
-        "location": location,
-        "industry": industry,
-        "radius_miles": 15,
-        "max_businesses": 10,
-        "crawl_sources": ["google_serp", "apify_gmaps", "yelp"],
-        "use_cache": False
-    }
+    # Metrics
+    if metrics.get('rating'):
+        yield 'rating'
     
+    # Category/type
+    if biz.get('category') or biz.get('industry'):
+        yield 'business_type'
+
+
+def test_industry_scan(industry, scan):
+    """Verify the data structure of a specific industry's scan result"""
     print(f"\n🔍 Testing {industry}...")
     
     try:
-        response = requests.post(url, json=payload, timeout=30)
+        if isinstance(scan, Exception):
+            raise scan
         
-        if response.status_code == 200:
-            data = response.json()
-            businesses = data.get('businesses', [])
+        if scan.get('success'):
+            businesses = scan.get('businesses', [])
             
             print(f"  ✅ Found {len(businesses)} businesses")
             
             # Check data completeness for frontend display
-            required_fields = {
-                'name': 0,
-                'website': 0,
-                'phone': 0,
-                'address': 0,
-                'city': 0,
-                'state': 0,
-                'zip_code': 0,
-                'rating': 0,
-                'business_type': 0
-            }
-            
+            present = Counter()
             for biz in businesses:
-                # Check main fields
-                if biz.get('name'):
-                    required_fields['name'] += 1
-                
-                # Check contact fields
-                contact = biz.get('contact', {})
-                if contact.get('website'):
-                    required_fields['website'] += 1
-                if contact.get('phone'):
-                    required_fields['phone'] += 1
-                
-                # Check address fields
-                address = biz.get('address', {})
-                if address.get('formatted_address') or address.get('line1'):
-                    required_fields['address'] += 1
-                if address.get('city'):
-                    required_fields['city'] += 1
-                if address.get('state'):
-                    required_fields['state'] += 1
-                if address.get('zip_code'):
-                    required_fields['zip_code'] += 1
-                
-                # Check metrics
-                metrics = biz.get('metrics', {})
-                if metrics.get('rating'):
-                    required_fields['rating'] += 1
-                
-                # Check category/type
-                if biz.get('category') or biz.get('industry'):
-                    required_fields['business_type'] += 1
+                present.update(_present_fields(biz))
+            required_fields = {field: present[field] for field in REQUIRED_FIELDS}
             
             # Display coverage statistics
             total = len(businesses)
@@ -89,9 +77,9 @@ def test_industry_scan(industry, location="San Francisco"):
                 print("\n  📋 Sample Businesses (first 3):")
                 for i, biz in enumerate(businesses[:3], 1):
                     name = biz.get('name', 'Unknown')
-                    website = biz.get('contact', {}).get('website', 'No website')
-                    phone = biz.get('contact', {}).get('phone', 'No phone')
-                    rating = biz.get('metrics', {}).get('rating', 'N/A')
+                    website = biz.get('contact', NO_FIELDS).get('website', 'No website')
+                    phone = biz.get('contact', NO_FIELDS).get('phone', 'No phone')
+                    rating = biz.get('metrics', NO_FIELDS).get('rating', 'N/A')
                     
                     print(f"\n    {i}. {name}")
                     print(f"       Website: {website}")
@@ -104,8 +92,8 @@ def test_industry_scan(industry, location="San Francisco"):
                 'field_coverage': required_fields
             }
         else:
-            print(f"  ❌ API Error: {response.status_code}")
-            return {'success': False, 'error': response.status_code}
+            print(f"  ❌ API Error: {scan.get('error')}")
+            return {'success': False, 'error': scan.get('error')}
             
     except Exception as e:
         print(f"  ❌ Error: {e}")
@@ -129,10 +117,10 @@ def main():
     
     results = {}
     
-    for industry in industries:
-        result = test_industry_scan(industry)
-        results[industry] = result
-        time.sleep(2)  # Rate limiting
+    scans = scan_industries(industries)
+    
+    for industry, scan in zip(industries, scans):
+        results[industry] = test_industry_scan(industry, scan)
     
     # Summary
     print("\n" + "=" * 60)
@@ -144,18 +132,17 @@ def main():
     
     # Calculate average field coverage
     if successful > 0:
-        field_totals = {}
-        for industry, result in results.items():
+        # One row of REQUIRED_FIELDS percentages per successful industry, averaged column-wise
+        coverage_rows = []
+        for result in results.values():
             if result.get('success'):
-                coverage = result.get('field_coverage', {})
+                coverage = result['field_coverage']
                 total = result.get('total', 1)
-                for field, count in coverage.items():
-                    if field not in field_totals:
-                        field_totals[field] = []
-                    field_totals[field].append((count / total * 100) if total > 0 else 0)
+                coverage_rows.append([coverage[field] / total * 100 if total > 0 else 0
+                                      for field in REQUIRED_FIELDS])
         
         print("\n📈 Average Field Coverage Across All Industries:")
-        for field, percentages in field_totals.items():
+        for field, percentages in zip(REQUIRED_FIELDS, zip(*coverage_rows)):
             avg = sum(percentages) / len(percentages)
             status = "✅" if avg >= 80 else "⚠️" if avg >= 50 else "❌"
             print(f"  {status} {field}: {avg:.0f}%")
@@ -2,36 +2,22 @@
 """
 Test website enrichment across all industries
 """
-import requests
-import json
-import time
+from scan_client import NO_FIELDS, scan_industries
 
-def test_industry_websites(industry, location="San Francisco"):
-    """Test website enrichment for a specific industry"""
-    url = "http://localhost:8000/intelligence/scan"
-    
-    payload = {
-        "location": location,
-        "industry": industry,
-        "radius_miles": 15,
-        "max_businesses": 10,  # Smaller batch for testing
-        "crawl_sources": [
-            "google_serp", "apify_gmaps", "yelp"
-        ],
-        "use_cache": False
-    }
-    
+
+def test_industry_websites(industry, scan):
+    """Test website enrichment for a specific industry's scan result"""
     try:
         print(f"\n🔍 Testing {industry}...")
-        response = requests.post(url, json=payload, timeout=60)
+        if isinstance(scan, Exception):
+            raise scan
         
-        if response.status_code == 200:
-            data = response.json()
-            businesses = data.get('businesses', [])
+        if scan.get('success'):
+            businesses = scan.get('businesses', [])
             
             # Count website coverage
             total = len(businesses)
-            with_website = sum(1 for b in businesses if b.get('contact', {}).get('website'))
+            with_website = sum(1 for b in businesses if b.get('contact', NO_FIELDS).get('website'))
             
             print(f"  Total businesses: {total}")
             print(f"  With websites: {with_website}/{total} ({with_website/total*100:.1f}%)")
@@ -40,7 +26,7 @@ def test_industry_websites(industry, location="San Francisco"):
             print("  Sample results:")
             for i, biz in enumerate(businesses[:3], 1):
                 name = biz.get('name', 'Unknown')
-                website = biz.get('contact', {}).get('website', 'No website')
+                website = biz.get('contact', NO_FIELDS).get('website', 'No website')
                 print(f"    {i}. {name}")
                 print(f"       Website: {website}")
             
@@ -51,8 +37,8 @@ def test_industry_websites(industry, location="San Francisco"):
                 'percentage': with_website/total*100 if total > 0 else 0
             }
         else:
-            print(f"  ❌ Failed: {response.status_code}")
-            return {'success': False, 'error': response.status_code}
+            print(f"  ❌ Failed: {scan.get('error')}")
+            return {'success': False, 'error': scan.get('error')}
             
     except Exception as e:
         print(f"  ❌ Error: {e}")
@@ -76,10 +62,10 @@ def main():
     
     results = {}
     
-    for industry in industries:
-        result = test_industry_websites(industry)
-        results[industry] = result
-        time.sleep(2)  # Rate limiting between tests
+    scans = scan_industries(industries, timeout=60)
+    
+    for industry, scan in zip(industries, scans):
+        results[industry] = test_industry_websites(industry, scan)
     
     # Summary
     print("\n" + "="*50)